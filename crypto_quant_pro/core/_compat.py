@@ -0,0 +1,8 @@
+"""Compatibility helpers across supported Python versions."""
+import sys
+from typing import Any
+
+# ``dataclass(slots=True)`` needs Python 3.10+; older interpreters keep a ``__dict__``
+DATACLASS_SLOTS: dict[str, Any] = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+__all__ = ["DATACLASS_SLOTS"]
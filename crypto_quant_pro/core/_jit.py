@@ -0,0 +1,35 @@
+"""
+Optional Numba JIT support for numeric kernels.
+
+Set ``CRYPTOQ_NOJIT=1`` to skip importing numba entirely (e.g. for quick unit test
+runs); the kernels then run as plain NumPy code.
+"""
+import os
+from typing import Any, Callable
+
+NUMBA_AVAILABLE = False
+
+if not os.getenv("CRYPTOQ_NOJIT"):
+    try:
+        from numba import njit, prange
+
+        NUMBA_AVAILABLE = True
+    except ImportError:
+        # Numba is an optional dependency - fall back to the no-op decorator below
+        pass
+
+if not NUMBA_AVAILABLE:
+    prange = range
+
+    def njit(*args: Any, **kwargs: Any) -> Any:
+        """No-op replacement for ``numba.njit`` when numba is disabled or not installed."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+
+        def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+            return func
+
+        return decorator
+
+
+__all__ = ["NUMBA_AVAILABLE", "njit", "prange"]
@@ -0,0 +1,385 @@
+"""
+Numeric kernels shared by the engines, risk and strategy modules.
+
+Kernels are compiled lazily with ``cache=True`` so the LLVM output is reused
+across processes; ``warmup`` compiles (or loads) all of them up front.
+
+Numba is optional. Loop kernels that would run as plain Python without it
+have a vectorized NumPy counterpart, and the public name is bound to
+whichever is faster in the current environment.
+"""
+import numpy as np
+
+from ._jit import NUMBA_AVAILABLE, njit, prange
+
+
+@njit(cache=True)
+def _drawdown_stats_loop(equity: np.ndarray) -> tuple[float, int]:
+    """
+    Maximum drawdown and longest drawdown duration in a single pass.
+
+    Args:
+        equity: Equity curve as a float64 array
+
+    Returns:
+        Tuple of (max drawdown as a fraction of the peak, max bars spent below a peak)
+    """
+    if equity.shape[0] == 0:
+        return 0.0, 0
+
+    peak = equity[0]
+    max_dd = 0.0
+    duration = 0
+    max_duration = 0
+    for i in range(equity.shape[0]):
+        value = equity[i]
+        if value >= peak:
+            peak = value
+            duration = 0
+        else:
+            duration += 1
+            dd = (peak - value) / peak
+            if dd > max_dd:
+                max_dd = dd
+            if duration > max_duration:
+                max_duration = duration
+
+    return max_dd, max_duration
+
+
+def _drawdown_stats_numpy(equity: np.ndarray) -> tuple[float, int]:
+    """NumPy form of ``_drawdown_stats_loop`` using running maxima."""
+    n = equity.shape[0]
+    if n == 0:
+        return 0.0, 0
+
+    peaks = np.maximum.accumulate(equity)
+    max_dd = float(((peaks - equity) / peaks).max())
+
+    # Bars since the most recent bar at (or tied with) its running peak
+    bars = np.arange(n)
+    last_peak = np.maximum.accumulate(np.where(equity >= peaks, bars, 0))
+    return max_dd, int((bars - last_peak).max())
+
+
+@njit(cache=True)
+def _equity_drawdown_loop(
+    closes: np.ndarray, cash: np.ndarray, quantity: np.ndarray, start_value: float
+) -> tuple[np.ndarray, float, int]:
+    """
+    Mark a single-symbol book to market and track drawdown in the same pass.
+
+    Equivalent to building the equity curve and then calling ``drawdown_stats``
+    on ``[start_value, *equity]``.
+
+    Args:
+        closes: Close price per bar
+        cash: Cash held per bar
+        quantity: Position size per bar (0 when flat)
+        start_value: Portfolio value before the first bar
+
+    Returns:
+        Tuple of (equity per bar, max drawdown fraction, max bars below a peak)
+    """
+    n = closes.shape[0]
+    equity = np.empty(n, dtype=np.float64)
+    peak = start_value
+    max_dd = 0.0
+    duration = 0
+    max_duration = 0
+    for i in range(n):
+        value = cash[i] + quantity[i] * closes[i]
+        equity[i] = value
+        if value >= peak:
+            peak = value
+            duration = 0
+        else:
+            duration += 1
+            dd = (peak - value) / peak
+            if dd > max_dd:
+                max_dd = dd
+            if duration > max_duration:
+                max_duration = duration
+
+    return equity, max_dd, max_duration
+
+
+def _equity_drawdown_numpy(
+    closes: np.ndarray, cash: np.ndarray, quantity: np.ndarray, start_value: float
+) -> tuple[np.ndarray, float, int]:
+    """NumPy form of ``_equity_drawdown_loop``."""
+    equity = cash + quantity * closes
+    max_dd, max_duration = _drawdown_stats_numpy(np.concatenate(([start_value], equity)))
+    return equity, max_dd, max_duration
+
+
+if NUMBA_AVAILABLE:
+    drawdown_stats = _drawdown_stats_loop
+    equity_drawdown = _equity_drawdown_loop
+else:
+    drawdown_stats = _drawdown_stats_numpy
+    equity_drawdown = _equity_drawdown_numpy
+
+
+@njit(cache=True)
+def _rolling_rsi_loop(closes: np.ndarray, period: int) -> np.ndarray:
+    """
+    RSI from simple rolling means of gains and losses.
+
+    Matches ``pandas`` ``rolling(period).mean()`` on the clipped price deltas: the
+    first delta counts as zero, the first ``period - 1`` values are NaN, and
+    windows with neither gains nor losses are NaN.
+
+    Args:
+        closes: Close prices as a float array
+        period: Rolling window length
+
+    Returns:
+        RSI values in [0, 100] aligned with ``closes``
+    """
+    n = closes.shape[0]
+    out = np.full(n, np.nan)
+    gains = np.zeros(n, dtype=np.float64)
+    losses = np.zeros(n, dtype=np.float64)
+
+    # Running window sums, plus how many non-zero terms each one holds
+    gain = 0.0
+    loss = 0.0
+    gain_count = 0
+    loss_count = 0
+    for i in range(n):
+        if i > 0:
+            delta = closes[i] - closes[i - 1]
+            if delta > 0.0:
+                gains[i] = delta
+                gain += delta
+                gain_count += 1
+            elif delta < 0.0:
+                losses[i] = -delta
+                loss -= delta
+                loss_count += 1
+        if i >= period:
+            j = i - period
+            if gains[j] > 0.0:
+                gain -= gains[j]
+                gain_count -= 1
+            elif losses[j] > 0.0:
+                loss -= losses[j]
+                loss_count -= 1
+        if i < period - 1:
+            continue
+
+        # Running sums leave rounding residue; windows with no moves are exactly zero
+        if gain_count == 0:
+            gain = 0.0
+        if loss_count == 0:
+            loss = 0.0
+        if loss > 0.0:
+            out[i] = 100.0 - 100.0 / (1.0 + gain / loss)
+        elif gain > 0.0:
+            out[i] = 100.0
+
+    return out
+
+
+def _window_sums(values: np.ndarray, window: int) -> np.ndarray:
+    """Sums of every full ``window``-length slice of ``values``."""
+    totals = np.concatenate((np.zeros(1, dtype=values.dtype), np.cumsum(values)))
+    return totals[window:] - totals[:-window]
+
+
+def _rolling_rsi_numpy(closes: np.ndarray, period: int) -> np.ndarray:
+    """NumPy form of ``_rolling_rsi_loop`` using cumulative-sum windows."""
+    n = closes.shape[0]
+    out = np.full(n, np.nan)
+    if n < period:
+        return out
+
+    delta = np.diff(closes.astype(np.float64), prepend=closes[0])
+    gains = np.where(delta > 0.0, delta, 0.0)
+    losses = np.where(delta < 0.0, -delta, 0.0)
+
+    # Integer counts are exact, so windows with no moves can be zeroed precisely
+    gain = _window_sums(gains, period)
+    gain[_window_sums((gains > 0.0).astype(np.int64), period) == 0] = 0.0
+    loss = _window_sums(losses, period)
+    loss[_window_sums((losses > 0.0).astype(np.int64), period) == 0] = 0.0
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        rsi = np.where(
+            loss > 0.0, 100.0 - 100.0 / (1.0 + gain / loss), np.where(gain > 0.0, 100.0, np.nan)
+        )
+    out[period - 1 :] = rsi
+    return out
+
+
+if NUMBA_AVAILABLE:
+    rolling_rsi = _rolling_rsi_loop
+else:
+    rolling_rsi = _rolling_rsi_numpy
+
+
+@njit(cache=True, parallel=True)
+def ma_cross_batch(closes: np.ndarray, fast: int, slow: int, out: np.ndarray) -> None:
+    """
+    Moving average crossover on the last bar for many symbols in parallel.
+
+    Writes ``1`` when the fast MA crosses above the slow MA, ``-1`` when it
+    crosses below and ``0`` otherwise (including rows with too few bars).
+
+    Args:
+        closes: Close prices of shape (n_symbols, n_bars)
+        fast: Fast moving average period
+        slow: Slow moving average period
+        out: Output int8 array of length n_symbols
+    """
+    n_bars = closes.shape[1]
+    for i in prange(closes.shape[0]):
+        out[i] = 0
+        if n_bars <= max(fast, slow):
+            continue
+        row = closes[i]
+        current_fast = row[n_bars - fast :].mean()
+        previous_fast = row[n_bars - fast - 1 : n_bars - 1].mean()
+        current_slow = row[n_bars - slow :].mean()
+        previous_slow = row[n_bars - slow - 1 : n_bars - 1].mean()
+        if previous_fast <= previous_slow and current_fast > current_slow:
+            out[i] = 1
+        elif previous_fast >= previous_slow and current_fast < current_slow:
+            out[i] = -1
+
+
+@njit(cache=True, fastmath=True)
+def markowitz_objective(weights: np.ndarray, sigma: np.ndarray) -> float:
+    """Portfolio variance w.T @ sigma @ w."""
+    return np.dot(weights, np.dot(sigma, weights))
+
+
+@njit(cache=True, fastmath=True)
+def markowitz_gradient(weights: np.ndarray, sigma: np.ndarray) -> np.ndarray:
+    """Gradient of the portfolio variance with respect to the weights."""
+    return 2.0 * np.dot(sigma, weights)
+
+
+@njit(cache=True, fastmath=True)
+def _risk_parity_iterate_loop(
+    weights: np.ndarray, sigma: np.ndarray, tol: float, max_iter: int
+) -> np.ndarray:
+    """
+    Equal-risk-contribution weights by multiplicative fixed-point updates.
+
+    Each step scales ``w_i`` by ``sqrt(target / rc_i)`` where ``rc_i = w_i * (sigma @ w)_i``
+    and ``target`` is the portfolio variance split evenly, then renormalizes to sum to 1.
+
+    Args:
+        weights: Initial weights (not modified)
+        sigma: Covariance matrix as a float64 array
+        tol: Stop once every risk contribution is within ``tol`` of the target,
+            relative to the portfolio variance
+        max_iter: Maximum number of iterations
+
+    Returns:
+        Weights summing to 1
+    """
+    n = weights.shape[0]
+    w = weights.copy()
+    mrc = np.empty(n, dtype=np.float64)
+
+    for _ in range(max_iter):
+        # mrc = sigma @ w, written into the scratch buffer
+        variance = 0.0
+        for i in range(n):
+            acc = 0.0
+            for j in range(n):
+                acc += sigma[i, j] * w[j]
+            mrc[i] = acc
+            variance += w[i] * acc
+        if variance <= 0.0:
+            break
+
+        target = variance / n
+        max_err = 0.0
+        total = 0.0
+        for i in range(n):
+            rc = w[i] * mrc[i]
+            err = abs(rc - target) / variance
+            if err > max_err:
+                max_err = err
+            if rc > 0.0:
+                w[i] *= np.sqrt(target / rc)
+            total += w[i]
+        for i in range(n):
+            w[i] /= total
+
+        if max_err < tol:
+            break
+
+    return w
+
+
+def _risk_parity_iterate_numpy(
+    weights: np.ndarray, sigma: np.ndarray, tol: float, max_iter: int
+) -> np.ndarray:
+    """NumPy form of ``_risk_parity_iterate_loop`` with matrix-vector products."""
+    n = weights.shape[0]
+    w = weights.copy()
+
+    for _ in range(max_iter):
+        mrc = sigma @ w
+        variance = float(w @ mrc)
+        if variance <= 0.0:
+            break
+
+        target = variance / n
+        rc = w * mrc
+        max_err = float(np.abs(rc - target).max()) / variance
+        positive = rc > 0.0
+        w[positive] *= np.sqrt(target / rc[positive])
+        w /= w.sum()
+
+        if max_err < tol:
+            break
+
+    return w
+
+
+if NUMBA_AVAILABLE:
+    risk_parity_iterate = _risk_parity_iterate_loop
+else:
+    risk_parity_iterate = _risk_parity_iterate_numpy
+
+
+@njit(cache=True, parallel=True)
+def markowitz_frontier(
+    w_min_var: np.ndarray, tilt: np.ndarray, risk_aversions: np.ndarray, out: np.ndarray
+) -> None:
+    """
+    Fill ``out[k] = w_min_var + tilt / risk_aversions[k]`` in parallel over ``k``.
+
+    Args:
+        w_min_var: Minimum-variance weights
+        tilt: Return-seeking direction (sums to 0)
+        risk_aversions: Risk-aversion coefficients
+        out: Output array of shape (len(risk_aversions), n_assets)
+    """
+    n = w_min_var.shape[0]
+    for k in prange(risk_aversions.shape[0]):
+        scale = 1.0 / risk_aversions[k]
+        for i in range(n):
+            out[k, i] = w_min_var[i] + tilt[i] * scale
+
+
+def warmup() -> None:
+    """Call every kernel once on tiny inputs to trigger compilation or cache load."""
+    equity = np.array([1.0, 0.5], dtype=np.float64)
+    weights = np.array([0.5, 0.5], dtype=np.float64)
+    sigma = np.eye(2, dtype=np.float64)
+
+    drawdown_stats(equity)
+    equity_drawdown(equity, equity, equity, 1.0)
+    rolling_rsi(equity, 1)
+    ma_cross_batch(np.ones((1, 3), dtype=np.float64), 1, 1, np.empty(1, dtype=np.int8))
+    markowitz_objective(weights, sigma)
+    markowitz_gradient(weights, sigma)
+    risk_parity_iterate(weights, sigma, 1e-10, 10)
+    markowitz_frontier(weights, weights, equity, np.empty((2, 2), dtype=np.float64))
@@ -5,6 +5,7 @@ from typing import Any, Callable, Optional
 
 from ...data.adapters.abu_adapter import AbuMarketAdapter
 from .backtesting_engine import BacktestingEngine
+from .models import Order
 from .paper_trading_engine import PaperTradingConfig, PaperTradingEngine
 from .trading_engine import TradingEngine
 
@@ -103,19 +104,12 @@ class AbuEngineAdapter:
             Order ID if successful, None otherwise
         """
         try:
-            if quantity > 0:
-                side = "buy"
-                qty = Decimal(str(quantity))
-            else:
-                side = "sell"
-                qty = Decimal(str(abs(quantity)))
-
+            side = "buy" if quantity > 0 else "sell"
+            # Exact decimal conversion: low-priced tokens can quote below satoshi resolution
+            qty = Decimal(str(abs(quantity)))
             price_decimal = Decimal(str(price)) if price else None
 
             if self._paper_engine:
-                # Create order object
-                from .trading_engine import Order
-
                 order = Order(
                     symbol=symbol,
                     side=side,
@@ -131,7 +125,7 @@ class AbuEngineAdapter:
                 result = asyncio.run(self._paper_engine.execute_order(order))
                 return order.id if result else None
 
-            elif self._backtest_engine:
+            if self._backtest_engine:
                 # Execute in backtest
                 if side == "buy":
                     return str(self._backtest_engine.buy(symbol, qty, price_decimal))
@@ -1,18 +1,43 @@
 """Backtesting engine for historical trading simulation."""
+from collections import deque
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from decimal import Decimal
 import inspect
 import logging
-from typing import Any, Callable, Optional
+from typing import Any, Callable, Optional, Union
 
+import numpy as np
 import pandas as pd
 
 from ...data import DatabaseManager, DataCleaner, MarketDataFeed, Timeframe
+from .._numba_kernels import drawdown_stats, equity_drawdown
 from .event_dispatcher import Event, EventDispatcher, EventType
 
 logger = logging.getLogger(__name__)
 
+# Column order of the per-symbol bar price arrays
+_PRICE_COLUMNS = ["open", "high", "low", "close"]
+_CLOSE = 3
+
+
+def _price_floats(prices: np.ndarray) -> list[float]:
+    """
+    Bar prices as Python floats.
+
+    float32 prices go through their shortest repr, so a cached 101.1 is published
+    as 101.1 rather than 101.0999984741211.
+
+    Args:
+        prices: Open, high, low, close of one bar
+
+    Returns:
+        List of four floats
+    """
+    if prices.dtype == np.float32:
+        return [float(str(price)) for price in prices]
+    return prices.tolist()
+
 
 @dataclass
 class BacktestConfig:
@@ -33,6 +58,10 @@ class BacktestConfig:
 
     # Performance tracking
     benchmark_symbol: Optional[str] = None  # Symbol to compare against
+    max_trade_history: Optional[int] = None  # Keep only the most recent trades (None = all)
+
+    # Market data
+    float32_ohlcv: bool = False  # Cache OHLC prices as float32 to halve replay bandwidth
 
 
 @dataclass
@@ -58,6 +87,9 @@ class BacktestResult:
     portfolio_values: list[Decimal]
     timestamps: list[datetime]
 
+    # Longest stretch (in bars) spent below a previous equity peak
+    max_drawdown_duration: int = 0
+
 
 class BacktestingEngine:
     """
@@ -94,10 +126,17 @@ class BacktestingEngine:
         self.equity_curve: list[Decimal] = [config.initial_capital]
         self.portfolio_history: list[Decimal] = [config.initial_capital]
         self.timestamps: list[datetime] = [config.start_date]
-        self.trades: list[dict[str, Any]] = []
+        self.trades: deque[dict[str, Any]] = deque(maxlen=config.max_trade_history)
+        # Running trade counts, unaffected by max_trade_history eviction
+        self._trade_count = 0
+        self._closed_trade_count = 0
+        self._profitable_trade_count = 0
 
         # Market data cache
         self.market_data_cache: dict[str, pd.DataFrame] = {}
+        # Bar times and OHLCV values per symbol for positional lookups, stored with
+        # the cached frame they were built from
+        self._bar_arrays: dict[str, tuple[pd.DataFrame, np.ndarray, np.ndarray, np.ndarray]] = {}
 
         # Event dispatcher for strategy integration
         self.event_dispatcher = EventDispatcher()
@@ -161,6 +200,134 @@ class BacktestingEngine:
         logger.info(f"Backtest completed. Total return: {result.total_return:.2%}")
         return result
 
+    def run_backtest_vectorized(
+        self,
+        signals: np.ndarray,
+        prices: Union[np.ndarray, pd.Series],
+        symbol: str,
+    ) -> BacktestResult:
+        """
+        Run a single-symbol backtest from a precomputed signal array.
+
+        Fills are processed in one NumPy sweep instead of calling a strategy
+        function per bar. Each entry invests ``max_position_size`` of the current
+        equity; slippage and commission are applied as in ``buy``/``sell``.
+        No events are published on the dispatcher.
+
+        Args:
+            signals: Array aligned with ``prices`` (+1 enter long, -1 exit, 0 hold)
+            prices: Close prices per bar (a Series index is used as timestamps)
+            symbol: Symbol recorded on the generated trades
+
+        Returns:
+            BacktestResult with performance metrics
+        """
+        signals = np.asarray(signals, dtype=np.int8)
+        if isinstance(prices, pd.Series):
+            index = prices.index
+            closes = prices.to_numpy(dtype=np.float64)
+        else:
+            closes = np.asarray(prices, dtype=np.float64)
+            index = pd.date_range(start=self.config.start_date, periods=len(closes), freq="D")
+
+        if signals.shape != closes.shape:
+            raise ValueError(
+                f"signals shape {signals.shape} does not match prices shape {closes.shape}"
+            )
+
+        n_bars = len(closes)
+        weight = float(self.config.max_position_size)
+        slippage = float(self.config.slippage)
+        commission = float(self.config.commission)
+        initial = float(self.config.initial_capital)
+
+        # Position state per bar: carry the last non-zero signal forward
+        last_signal_idx = np.maximum.accumulate(np.where(signals != 0, np.arange(n_bars), 0))
+        held = signals[last_signal_idx] > 0
+        pos_diff = np.diff(held.astype(np.int8), prepend=np.int8(0))
+        entries = np.flatnonzero(pos_diff > 0)
+        exits = np.flatnonzero(pos_diff < 0)
+
+        # Per-trade prices and equity multipliers
+        entry_prices = closes[entries] * (1 + slippage)
+        entry_costs = entry_prices * (1 + commission)
+        exit_prices = closes[exits] * (1 - slippage)
+        multipliers = (1 - weight) + weight * exit_prices * (1 - commission) / entry_costs[
+            : len(exits)
+        ]
+        growth = np.concatenate(([1.0], np.cumprod(multipliers)))
+        entry_equity = initial * growth[: len(entries)]
+        quantities = weight * entry_equity / entry_costs
+
+        # Cash and position size per bar: compounded cash when flat, the uninvested
+        # remainder plus the open quantity when long
+        cash = initial * growth[np.cumsum(pos_diff < 0)]
+        qty_per_bar = np.zeros(n_bars, dtype=np.float64)
+        if len(entries):
+            trade_idx = np.maximum(np.cumsum(pos_diff > 0) - 1, 0)
+            cash = np.where(held, entry_equity[trade_idx] * (1 - weight), cash)
+            qty_per_bar = np.where(held, quantities[trade_idx], 0.0)
+
+        # Mark to market and track drawdown in one pass
+        equity, max_dd, max_dd_duration = equity_drawdown(closes, cash, qty_per_bar, initial)
+
+        trades: list[dict[str, Any]] = []
+        for k, entry in enumerate(entries):
+            quantity = Decimal(str(quantities[k]))
+            entry_price = Decimal(str(entry_prices[k]))
+            trades.append(
+                {
+                    "timestamp": index[entry],
+                    "symbol": symbol,
+                    "side": "buy",
+                    "quantity": quantity,
+                    "price": entry_price,
+                    "commission": Decimal(str(quantities[k] * entry_prices[k] * commission)),
+                    "type": "market",
+                }
+            )
+            if k < len(exits):
+                exit_price = Decimal(str(exit_prices[k]))
+                trades.append(
+                    {
+                        "timestamp": index[exits[k]],
+                        "symbol": symbol,
+                        "side": "sell",
+                        "quantity": quantity,
+                        "price": exit_price,
+                        "commission": Decimal(str(quantities[k] * exit_prices[k] * commission)),
+                        "realized_pnl": (exit_price - entry_price) * quantity,
+                        "type": "market",
+                    }
+                )
+
+        # Final engine state
+        self.trades = deque(maxlen=self.config.max_trade_history)
+        self._trade_count = self._closed_trade_count = self._profitable_trade_count = 0
+        for trade in trades:
+            self._record_trade(trade)
+        self.positions = {}
+        if len(entries) > len(exits):
+            self.positions[symbol] = {
+                "quantity": Decimal(str(quantities[-1])),
+                "avg_price": Decimal(str(entry_prices[-1])),
+                "unrealized_pnl": Decimal(str((closes[-1] - entry_prices[-1]) * quantities[-1])),
+            }
+            self.cash = Decimal(str(entry_equity[-1] * (1 - weight)))
+        elif n_bars:
+            self.cash = Decimal(str(equity[-1]))
+        else:
+            self.cash = self.config.initial_capital
+        self.portfolio_history = [self.config.initial_capital] + [
+            Decimal(str(v)) for v in equity.tolist()
+        ]
+        self.timestamps = [self.config.start_date] + list(index)
+        self.portfolio_value = self.portfolio_history[-1]
+        if n_bars:
+            self.current_date = index[-1]
+
+        return self._calculate_results(drawdown=(max_dd, max_dd_duration))
+
     async def _load_historical_data(self, symbols: list[str], timeframe: Timeframe) -> None:
         """
         Load historical data for backtesting period.
@@ -179,7 +346,7 @@ class BacktestingEngine:
                         end_date=self.config.end_date,
                     )
                     if data is not None:
-                        self.market_data_cache[symbol] = data
+                        self.market_data_cache[symbol] = self._prepare_cached_data(data)
                         continue
 
                 # Fallback to data feed
@@ -193,7 +360,7 @@ class BacktestingEngine:
                 if data is not None:
                     # Clean and cache data
                     data = DataCleaner.clean_ohlcv_data(data)
-                    self.market_data_cache[symbol] = data
+                    self.market_data_cache[symbol] = self._prepare_cached_data(data)
 
                     # Store in database for future use
                     if self.database:
@@ -209,6 +376,12 @@ class BacktestingEngine:
             except Exception as e:
                 logger.error(f"Failed to load data for {symbol}: {e}")
 
+    def _prepare_cached_data(self, data: pd.DataFrame) -> pd.DataFrame:
+        """Apply the configured price dtype to data before it is cached."""
+        if self.config.float32_ohlcv:
+            return DataCleaner.to_float32_ohlcv(data)
+        return data
+
     async def _update_market_data(self, date: datetime, symbols: list[str]) -> None:
         """
         Update market data for current backtest date.
@@ -218,34 +391,68 @@ class BacktestingEngine:
             symbols: Symbols to update
         """
         for symbol in symbols:
-            if symbol in self.market_data_cache:
-                data = self.market_data_cache[symbol]
-
-                # Find data for current date
-                if isinstance(data.index, pd.DatetimeIndex):
-                    # Get data up to current date
-                    current_data = data[data.index <= date]
-
-                    if not current_data.empty:
-                        latest_row = current_data.iloc[-1]
-
-                        # Publish market data event
-                        self.event_dispatcher.publish(
-                            Event(
-                                type=EventType.MARKET_DATA_UPDATE,
-                                timestamp=date,
-                                data={
-                                    "symbol": symbol,
-                                    "open": float(latest_row["open"]),
-                                    "high": float(latest_row["high"]),
-                                    "low": float(latest_row["low"]),
-                                    "close": float(latest_row["close"]),
-                                    "volume": float(latest_row["volume"]),
-                                    "date": date.isoformat(),
-                                },
-                                source="backtesting_engine",
-                            )
-                        )
+            # Latest bar up to current date
+            bar = self._latest_bar(symbol, date)
+            if bar is not None:
+                prices, volume = bar
+                open_, high, low, close = _price_floats(prices)
+
+                # Publish market data event
+                self.event_dispatcher.publish(
+                    Event(
+                        type=EventType.MARKET_DATA_UPDATE,
+                        timestamp=date,
+                        data={
+                            "symbol": symbol,
+                            "open": open_,
+                            "high": high,
+                            "low": low,
+                            "close": close,
+                            "volume": volume,
+                            "date": date.isoformat(),
+                        },
+                        source="backtesting_engine",
+                    )
+                )
+
+    def _latest_bar(self, symbol: str, date: datetime) -> Optional[tuple[np.ndarray, float]]:
+        """
+        Get the latest OHLCV bar at or before a date.
+
+        Prices keep the dtype of the cached data (float32 with ``float32_ohlcv``).
+        The bar arrays are rebuilt whenever ``market_data_cache[symbol]`` is
+        replaced or changes length.
+
+        Args:
+            symbol: Trading symbol
+            date: Point in time to look up
+
+        Returns:
+            Tuple of (open/high/low/close array, volume) or None if no bar is available
+        """
+        cached = self.market_data_cache.get(symbol)
+        if cached is None or not isinstance(cached.index, pd.DatetimeIndex):
+            return None
+
+        arrays = self._bar_arrays.get(symbol)
+        if arrays is None or arrays[0] is not cached or len(arrays[1]) != len(cached):
+            data = cached if cached.index.is_monotonic_increasing else cached.sort_index()
+            price_dtype = (
+                np.float32 if (data[_PRICE_COLUMNS].dtypes == np.float32).all() else np.float64
+            )
+            arrays = (
+                cached,
+                data.index.to_numpy(dtype="datetime64[ns]"),
+                data[_PRICE_COLUMNS].to_numpy(dtype=price_dtype),
+                data["volume"].to_numpy(dtype=np.float64),
+            )
+            self._bar_arrays[symbol] = arrays
+
+        _, times, prices, volumes = arrays
+        pos = int(np.searchsorted(times, np.datetime64(date, "ns"), side="right")) - 1
+        if pos < 0:
+            return None
+        return prices[pos], float(volumes[pos])
 
     def buy(self, symbol: str, quantity: Decimal, price: Optional[Decimal] = None) -> bool:
         """
@@ -307,7 +514,7 @@ class BacktestingEngine:
                 "commission": commission,
                 "type": "market" if price is None else "limit",
             }
-            self.trades.append(trade)
+            self._record_trade(trade)
 
             # Publish order event
             self.event_dispatcher.publish(
@@ -391,7 +598,7 @@ class BacktestingEngine:
                 "realized_pnl": realized_pnl,
                 "type": "market" if price is None else "limit",
             }
-            self.trades.append(trade)
+            self._record_trade(trade)
 
             # Publish order event
             self.event_dispatcher.publish(
@@ -410,6 +617,15 @@ class BacktestingEngine:
             logger.error(f"Error executing sell order: {e}")
             return False
 
+    def _record_trade(self, trade: dict[str, Any]) -> None:
+        """Append a trade to the history and update the running trade counts."""
+        self.trades.append(trade)
+        self._trade_count += 1
+        if "realized_pnl" in trade:
+            self._closed_trade_count += 1
+            if trade["realized_pnl"] > 0:
+                self._profitable_trade_count += 1
+
     def _get_current_price(self, symbol: str) -> Optional[Decimal]:
         """
         Get current price for symbol.
@@ -421,13 +637,11 @@ class BacktestingEngine:
             Current price or None if not available
         """
         try:
-            if symbol in self.market_data_cache:
-                data = self.market_data_cache[symbol]
-                if not data.empty:
-                    # Get latest data up to current date
-                    current_data = data[data.index <= self.current_date]
-                    if not current_data.empty:
-                        return Decimal(str(current_data.iloc[-1]["close"]))
+            # Get latest data up to current date
+            bar = self._latest_bar(symbol, self.current_date)
+            if bar is not None:
+                # str() of a NumPy scalar is its shortest repr in its own dtype
+                return Decimal(str(bar[0][_CLOSE]))
         except Exception as e:
             logger.error(f"Error getting current price for {symbol}: {e}")
 
@@ -458,10 +672,14 @@ class BacktestingEngine:
         self.portfolio_history.append(total_value)
         self.timestamps.append(date)
 
-    def _calculate_results(self) -> BacktestResult:
+    def _calculate_results(self, drawdown: Optional[tuple[float, int]] = None) -> BacktestResult:
         """
         Calculate backtest performance metrics.
 
+        Args:
+            drawdown: Precomputed (max drawdown, duration) of the portfolio history,
+                if the caller already tracked it
+
         Returns:
             BacktestResult with all metrics
         """
@@ -495,12 +713,16 @@ class BacktestingEngine:
         else:
             annualized_return = Decimal("0")
 
-        # Volatility (daily returns)
-        # Convert to float for pandas calculations
-        portfolio_floats = [float(x) for x in self.portfolio_history]
+        # Metrics are computed on a float64 array; Decimal only at the result boundary
+        portfolio_floats = np.array([float(x) for x in self.portfolio_history], dtype=np.float64)
         portfolio_series = pd.Series(portfolio_floats, index=self.timestamps)
-        daily_returns = portfolio_series.pct_change().dropna()
-        volatility = Decimal(str(daily_returns.std() * (252**0.5)))  # Annualized
+
+        # Volatility (daily returns)
+        daily_returns = np.diff(portfolio_floats) / portfolio_floats[:-1]
+        if len(daily_returns) > 1:
+            volatility = Decimal(str(daily_returns.std(ddof=1) * (252**0.5)))  # Annualized
+        else:
+            volatility = Decimal("0")
 
         # Sharpe ratio
         risk_free_rate = Decimal("0.02")  # 2% annual risk-free rate
@@ -509,20 +731,22 @@ class BacktestingEngine:
         else:
             sharpe_ratio = Decimal("0")
 
-        # Maximum drawdown
-        rolling_max = portfolio_series.expanding().max()
-        drawdowns = (portfolio_series - rolling_max) / rolling_max
-        max_drawdown = Decimal(str(abs(drawdowns.min())))
+        # Maximum drawdown and its duration
+        if drawdown is None:
+            drawdown = drawdown_stats(portfolio_floats)
+        max_dd, max_dd_duration = drawdown
+        max_drawdown = Decimal(str(float(max_dd)))
 
-        # Win rate - count closed positions (trades with realized_pnl)
-        profitable_trades = sum(1 for trade in self.trades if trade.get("realized_pnl", 0) > 0)
-        closed_trades = len([t for t in self.trades if "realized_pnl" in t])
+        # Win rate - count closed positions (trades with realized_pnl), including
+        # trades already evicted from a bounded history
+        closed_trades = self._closed_trade_count
+        profitable_trades = self._profitable_trade_count
         win_rate = (
             Decimal(str(profitable_trades / closed_trades)) if closed_trades > 0 else Decimal("0")
         )
 
         # Total trades includes all orders (buy and sell)
-        total_trades = len(self.trades)
+        total_trades = self._trade_count
 
         return BacktestResult(
             total_return=total_return,
@@ -534,9 +758,10 @@ class BacktestingEngine:
             total_trades=total_trades,
             profitable_trades=profitable_trades,
             equity_curve=portfolio_series,
-            trades=self.trades,
+            trades=list(self.trades),
             portfolio_values=self.portfolio_history,
             timestamps=self.timestamps,
+            max_drawdown_duration=int(max_dd_duration),
         )
 
     # Public interface methods
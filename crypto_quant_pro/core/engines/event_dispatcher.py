@@ -1,11 +1,14 @@
 """Event dispatcher for trading system coordination."""
 import asyncio
+import bisect
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 import logging
 from typing import Any, Callable, Optional
 
+from .._compat import DATACLASS_SLOTS
+
 logger = logging.getLogger(__name__)
 
 
@@ -43,9 +46,9 @@ class EventType(Enum):
     ERROR_OCCURRED = "error_occurred"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class Event:
-    """Trading system event."""
+    """Trading system event (slotted on Python 3.10+, one is created per tick)."""
 
     type: EventType
     timestamp: datetime
@@ -59,6 +62,43 @@ class Event:
             self.timestamp = datetime.utcnow()
 
 
+def enable_eager_tasks() -> bool:
+    """
+    Install asyncio's eager task factory on the running loop (Python 3.12+).
+
+    Eager tasks run synchronously until their first real suspension, so handlers
+    and bookkeeping coroutines that never await complete without a loop
+    iteration. A task factory already installed on the loop is left untouched.
+
+    Returns:
+        True if the factory was installed; the caller then owns it and should
+        call ``disable_eager_tasks`` when it stops
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    if eager_task_factory is None:
+        return False
+
+    loop = asyncio.get_running_loop()
+    if loop.get_task_factory() is not None:
+        return False
+
+    loop.set_task_factory(eager_task_factory)
+    return True
+
+
+def disable_eager_tasks() -> None:
+    """
+    Restore the default task factory on the running loop.
+
+    Only removes the factory installed by ``enable_eager_tasks``; a factory
+    set by someone else in the meantime is left in place.
+    """
+    eager_task_factory = getattr(asyncio, "eager_task_factory", None)
+    loop = asyncio.get_running_loop()
+    if eager_task_factory is not None and loop.get_task_factory() is eager_task_factory:
+        loop.set_task_factory(None)
+
+
 class EventHandler:
     """Handler for trading events."""
 
@@ -73,6 +113,10 @@ class EventHandler:
         self.callback = callback
         self.priority = priority
 
+    def __lt__(self, other: "EventHandler") -> bool:
+        """Order handlers so that higher priority sorts first."""
+        return self.priority > other.priority
+
     def __call__(self, event: Event) -> Any:
         """Execute handler callback."""
         try:
@@ -97,6 +141,7 @@ class EventDispatcher:
         self._event_queue: Optional[asyncio.Queue[Event]] = None
         self._running = False
         self._task: Optional[asyncio.Task] = None
+        self._owns_task_factory = False
 
     def subscribe(
         self, event_type: EventType, callback: Callable[[Event], None], priority: int = 1
@@ -112,11 +157,9 @@ class EventDispatcher:
         if event_type not in self._handlers:
             self._handlers[event_type] = []
 
+        # Keep handlers ordered by priority (highest first, FIFO among equals)
         handler = EventHandler(callback, priority)
-        self._handlers[event_type].append(handler)
-
-        # Sort handlers by priority (highest first)
-        self._handlers[event_type].sort(key=lambda h: h.priority, reverse=True)
+        bisect.insort_right(self._handlers[event_type], handler)
 
         logger.debug(f"Subscribed handler for {event_type.value}")
 
@@ -152,11 +195,9 @@ class EventDispatcher:
         if event_type not in self._async_handlers:
             self._async_handlers[event_type] = []
 
+        # Keep handlers ordered by priority (highest first, FIFO among equals)
         handler = EventHandler(callback, priority)
-        self._async_handlers[event_type].append(handler)
-
-        # Sort handlers by priority (highest first)
-        self._async_handlers[event_type].sort(key=lambda h: h.priority, reverse=True)
+        bisect.insort_right(self._async_handlers[event_type], handler)
 
         logger.debug(f"Subscribed async handler for {event_type.value}")
 
@@ -220,6 +261,8 @@ class EventDispatcher:
         if self._running:
             return
 
+        self._owns_task_factory = enable_eager_tasks()
+
         self._event_queue = asyncio.Queue()
         self._running = True
         self._task = asyncio.create_task(self._process_events())
@@ -259,20 +302,25 @@ class EventDispatcher:
         # Don't use queue for shutdown event
         self._process_event(shutdown_event)
 
+        if self._owns_task_factory:
+            disable_eager_tasks()
+            self._owns_task_factory = False
+
         logger.info("Event dispatcher stopped")
 
     async def _process_events(self) -> None:
         """Main event processing loop."""
         while self._running and self._event_queue:
             try:
-                # Wait for next event with timeout
-                event = await asyncio.wait_for(self._event_queue.get(), timeout=1.0)
+                # Drain queued events without awaiting; only block when the queue is empty
+                try:
+                    event = self._event_queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    event = await self._event_queue.get()
+
                 await self._process_event_async(event)
                 self._event_queue.task_done()
 
-            except asyncio.TimeoutError:
-                # No events, continue loop
-                continue
             except asyncio.CancelledError:
                 break
             except Exception as e:
@@ -1,9 +1,40 @@
 """Data models for trading engines."""
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_DOWN, Decimal
 from typing import Any, Optional
 
+# Fixed-point scale for integer ("satoshi") amounts: 1 unit == 1e-8
+SCALE = 10**8
+_SCALE_DECIMAL = Decimal(SCALE)
+
+
+def to_sats(value: Decimal, rounding: str = ROUND_DOWN) -> int:
+    """
+    Convert a decimal amount to integer satoshis.
+
+    Args:
+        value: Decimal amount
+        rounding: Decimal rounding mode for digits below 1e-8 (truncates by default)
+
+    Returns:
+        Amount scaled by ``SCALE``
+    """
+    return int((value * SCALE).to_integral_value(rounding=rounding))
+
+
+def from_sats(value: int) -> Decimal:
+    """
+    Convert integer satoshis back to a decimal amount.
+
+    Args:
+        value: Amount scaled by ``SCALE``
+
+    Returns:
+        Decimal amount
+    """
+    return Decimal(value) / _SCALE_DECIMAL
+
 
 class Order:
     """Trading order representation."""
@@ -2,16 +2,24 @@
 import asyncio
 from dataclasses import dataclass
 from datetime import datetime
-from decimal import Decimal
+from decimal import ROUND_CEILING, Decimal
 import logging
 from typing import Any, Optional
 
 from ...data import DatabaseManager, MarketDataFeed
 from .event_dispatcher import Event, EventDispatcher, EventType
-from .models import Order, Position
+from .models import SCALE, Order, Position, from_sats, to_sats
 
 logger = logging.getLogger(__name__)
 
+# Basis points per unit of commission rate
+_BPS = 10_000
+
+
+def _ceil_div(numerator: int, denominator: int) -> int:
+    """Integer division rounding up, for amounts debited from the account."""
+    return -(-numerator // denominator)
+
 
 @dataclass
 class PaperTradingConfig:
@@ -62,9 +70,13 @@ class PaperTradingEngine:
         self.data_feed = data_feed
         self.database = database
 
-        # Account state
+        # Commission rates in basis points as exact integer ratios (numerator, denominator)
+        self._maker_bps = (self.config.commission_maker * _BPS).as_integer_ratio()
+        self._taker_bps = (self.config.commission_taker * _BPS).as_integer_ratio()
+
+        # Account state (available cash is kept as integer satoshis)
         self.balance = self.config.initial_balance
-        self.available_balance = self.balance
+        self._available_sats = to_sats(self.balance)
         self.total_pnl = Decimal("0")
         self.unrealized_pnl = Decimal("0")
 
@@ -85,6 +97,15 @@ class PaperTradingEngine:
 
         logger.info(f"Paper trading engine initialized with ${self.balance} balance")
 
+    @property
+    def available_balance(self) -> Decimal:
+        """Available cash as a Decimal view of the satoshi ledger."""
+        return from_sats(self._available_sats)
+
+    @available_balance.setter
+    def available_balance(self, value: Decimal) -> None:
+        self._available_sats = to_sats(value)
+
     def _setup_event_handlers(self) -> None:
         """Setup internal event handlers."""
         # Market data updates
@@ -117,17 +138,37 @@ class PaperTradingEngine:
                 order.status = "rejected"
                 return False
 
-            # Apply commissions and fees
-            commission = self._calculate_commission(order, execution_price)
+            # Convert to satoshis once; the cash ledger is updated with integer arithmetic.
+            # Digits below 1e-8 are rounded against the account: debits (buy notional
+            # and fees) up, credits (sell notional) down.
+            quantity_sats = to_sats(order.quantity)
+            price_sats = to_sats(execution_price)
+            if quantity_sats <= 0 or price_sats <= 0:
+                logger.warning(f"Order for {order.symbol} is below satoshi resolution")
+                order.status = "rejected"
+                return False
+            quantity_up = to_sats(order.quantity, ROUND_CEILING)
+            price_up = to_sats(execution_price, ROUND_CEILING)
+            gross_up = quantity_up * price_up
+            if order.side == "buy":
+                notional_sats = _ceil_div(gross_up, SCALE)
+            else:
+                notional_sats = quantity_sats * price_sats // SCALE
+            commission_sats = self._calculate_commission(order, gross_up)
+
+            if order.side == "buy" and notional_sats + commission_sats > self._available_sats:
+                logger.warning(f"Insufficient balance for {order.symbol} after rounding")
+                order.status = "rejected"
+                return False
 
             # Update order details
             order.status = "filled"
             order.filled_quantity = order.quantity
             order.filled_price = execution_price
-            order.fees = commission
+            order.fees = from_sats(commission_sats)
 
             # Update account and positions
-            await self._update_account_from_order(order)
+            await self._update_account_from_order(order, notional_sats, commission_sats)
 
             # Record order
             self.order_history.append(order.to_dict())
@@ -226,13 +267,9 @@ class PaperTradingEngine:
                     return None
                 execution_price = current_price
 
-            # Apply slippage
-            if order.side == "buy":
-                execution_price *= 1 + self.config.slippage
-            else:  # sell
-                execution_price *= 1 - self.config.slippage
-
-            return execution_price
+            # Apply slippage against the order: +1 for buys (pay more), -1 for sells
+            side_sign = 1 if order.side == "buy" else -1
+            return execution_price * (1 + side_sign * self.config.slippage)
 
         except Exception as e:
             logger.error(f"Error getting execution price: {e}")
@@ -291,43 +328,43 @@ class PaperTradingEngine:
         except Exception:
             return None
 
-    def _calculate_commission(self, order: Order, execution_price: Decimal) -> Decimal:
+    def _calculate_commission(self, order: Order, gross: int) -> int:
         """
-        Calculate trading commission for order.
+        Calculate trading commission for order, rounded up to the next satoshi.
 
         Args:
             order: Order being executed
-            execution_price: Execution price
+            gross: Quantity in satoshis times price in satoshis (scaled by ``SCALE**2``)
 
         Returns:
-            Commission amount
+            Commission amount in satoshis
         """
-        order_value = order.quantity * execution_price
-
         # Use maker/taker fees based on order type
         if order.order_type == "limit":
-            commission_rate = self.config.commission_maker
+            bps, denominator = self._maker_bps
         else:
-            commission_rate = self.config.commission_taker
+            bps, denominator = self._taker_bps
 
-        return order_value * commission_rate
+        return _ceil_div(gross * bps, SCALE * _BPS * denominator)
 
-    async def _update_account_from_order(self, order: Order) -> None:
+    async def _update_account_from_order(
+        self, order: Order, notional_sats: int, commission_sats: int
+    ) -> None:
         """
         Update account balance and positions from filled order.
 
         Args:
             order: Filled order
+            notional_sats: Filled quantity times price, in satoshis
+            commission_sats: Commission charged, in satoshis
         """
         symbol = order.symbol
         quantity = order.filled_quantity
         price = order.filled_price
-        commission = order.fees
 
         if order.side == "buy":
             # Debit account
-            cost = (quantity * price) + commission
-            self.available_balance -= cost
+            self._available_sats -= notional_sats + commission_sats
 
             # Update position
             if symbol not in self.positions:
@@ -352,8 +389,7 @@ class PaperTradingEngine:
 
         else:  # sell
             # Credit account
-            proceeds = (quantity * price) - commission
-            self.available_balance += proceeds
+            self._available_sats += notional_sats - commission_sats
 
             # Update position
             if symbol in self.positions:
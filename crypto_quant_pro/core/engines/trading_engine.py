@@ -7,12 +7,21 @@ import logging
 from typing import Optional
 
 from ...data import DatabaseManager, MarketDataFeed
-from .event_dispatcher import Event, EventDispatcher, EventType
+from .event_dispatcher import (
+    Event,
+    EventDispatcher,
+    EventType,
+    disable_eager_tasks,
+    enable_eager_tasks,
+)
 from .models import Order, Position
 from .paper_trading_engine import PaperTradingEngine
 
 logger = logging.getLogger(__name__)
 
+# Accepted order sides, checked on every order
+_ORDER_SIDES = frozenset({"buy", "sell"})
+
 
 @dataclass
 class TradingConfig:
@@ -75,6 +84,7 @@ class TradingEngine:
         self.running = False
         self._market_data_task: Optional[asyncio.Task] = None
         self._risk_monitor_task: Optional[asyncio.Task] = None
+        self._owns_task_factory = False
 
         # Setup event handlers
         self._setup_event_handlers()
@@ -100,6 +110,9 @@ class TradingEngine:
 
         self.running = True
 
+        # Let background tasks and handlers that never await finish inline
+        self._owns_task_factory = enable_eager_tasks()
+
         # Start event dispatcher
         await self.event_dispatcher.start()
 
@@ -137,6 +150,11 @@ class TradingEngine:
         # Close all positions (emergency)
         await self._close_all_positions()
 
+        # Give the caller's loop back its default task factory
+        if self._owns_task_factory:
+            disable_eager_tasks()
+            self._owns_task_factory = False
+
         logger.info("Trading engine stopped")
 
     async def _market_data_loop(self) -> None:
@@ -241,8 +259,12 @@ class TradingEngine:
         Returns:
             True if valid, False otherwise
         """
-        # Basic validations
-        if side not in ["buy", "sell"]:
+        # Basic validations (plain string checks; symbol formats differ between feeds)
+        if not symbol or symbol != symbol.strip():
+            logger.error(f"Invalid order symbol: {symbol!r}")
+            return False
+
+        if side not in _ORDER_SIDES:
             logger.error(f"Invalid order side: {side}")
             return False
 
@@ -7,6 +7,55 @@ from typing import Optional
 import numpy as np
 import pandas as pd
 
+from .._numba_kernels import (
+    markowitz_frontier,
+    markowitz_gradient,
+    markowitz_objective,
+    risk_parity_iterate,
+)
+
+# Convergence settings for the risk parity fixed-point iteration
+_RISK_PARITY_TOL = 1e-10
+_RISK_PARITY_MAX_ITER = 1000
+
+# Bisection steps when fitting weights into the per-asset bounds
+_BOUNDS_BISECTION_STEPS = 100
+
+# Floor for weights relative to the largest one, keeping the bisection bracket finite
+_MIN_RELATIVE_WEIGHT = 1e-12
+
+
+def _scale_into_bounds(weights: np.ndarray, lower: float, upper: float) -> np.ndarray:
+    """
+    Fit positive weights into ``[lower, upper]`` with a total of 1.
+
+    Finds the scale ``t`` where ``clip(t * weights, lower, upper)`` sums to 1, so
+    assets that hit a bound are pinned there and the rest keep their relative
+    sizes. Requires ``len(weights) * lower <= 1 <= len(weights) * upper``.
+    Weights that are zero (e.g. underflowed next to zero-variance assets) are
+    floored at a tiny fraction of the largest weight.
+
+    Args:
+        weights: Non-negative, finite unconstrained weights with a positive maximum
+        lower: Minimum weight per asset
+        upper: Maximum weight per asset
+
+    Returns:
+        Bounded weights summing to 1
+    """
+    weights = np.maximum(weights, weights.max() * _MIN_RELATIVE_WEIGHT)
+
+    # The clipped sum grows with t: n * lower at t = 0, n * upper once all are capped
+    t_low, t_high = 0.0, upper / weights.min()
+    for _ in range(_BOUNDS_BISECTION_STEPS):
+        t_mid = 0.5 * (t_low + t_high)
+        if np.clip(t_mid * weights, lower, upper).sum() < 1.0:
+            t_low = t_mid
+        else:
+            t_high = t_mid
+
+    return np.clip(t_high * weights, lower, upper)
+
 
 class OptimizationMethod(Enum):
     """Portfolio optimization methods."""
@@ -64,10 +113,10 @@ class PortfolioOptimizer:
         if not symbols:
             return {}
 
-        weight_per_symbol = Decimal("1") / Decimal(str(len(symbols)))
-        allocation_per_symbol = portfolio_value * weight_per_symbol
+        # Single Decimal division shared by every symbol
+        allocation_per_symbol = portfolio_value / Decimal(len(symbols))
 
-        return {symbol: allocation_per_symbol for symbol in symbols}
+        return dict.fromkeys(symbols, allocation_per_symbol)
 
     def optimize_markowitz(
         self,
@@ -96,9 +145,8 @@ class PortfolioOptimizer:
 
         n_assets = len(symbols)
 
-        # Objective function: minimize portfolio variance
-        def objective(weights):
-            return np.dot(weights.T, np.dot(covariance_matrix.values, weights))
+        # Contiguous float64 covariance for the jitted objective/gradient
+        sigma = np.ascontiguousarray(covariance_matrix.to_numpy(dtype=np.float64))
 
         # Constraints
         constraints = [{"type": "eq", "fun": lambda w: np.sum(w) - 1}]
@@ -111,8 +159,16 @@ class PortfolioOptimizer:
         # Initial guess (equal weights)
         x0 = np.array([1.0 / n_assets] * n_assets)
 
-        # Optimize
-        result = minimize(objective, x0, method="SLSQP", bounds=bounds, constraints=constraints)
+        # Optimize: minimize portfolio variance
+        result = minimize(
+            markowitz_objective,
+            x0,
+            args=(sigma,),
+            jac=markowitz_gradient,
+            method="SLSQP",
+            bounds=bounds,
+            constraints=constraints,
+        )
 
         if result.success:
             weights = result.x
@@ -127,6 +183,42 @@ class PortfolioOptimizer:
 
         return allocations
 
+    def optimize_markowitz_grid(
+        self,
+        symbols: list[str],
+        expected_returns: pd.Series,
+        covariance_matrix: pd.DataFrame,
+        risk_aversions: np.ndarray,
+    ) -> np.ndarray:
+        """
+        Mean-variance weights for a sweep of risk-aversion coefficients.
+
+        Solves ``max w.mu - lambda / 2 * w.Sigma.w`` subject to ``sum(w) == 1`` in
+        closed form for every lambda, sharing a single covariance solve. Weight
+        bounds from the config are not applied (short positions may appear).
+
+        Args:
+            symbols: List of symbols (defines the column order)
+            expected_returns: Expected returns for each symbol
+            covariance_matrix: Covariance matrix
+            risk_aversions: Positive risk-aversion coefficients
+
+        Returns:
+            Array of shape (len(risk_aversions), len(symbols)); each row sums to 1
+        """
+        mu = expected_returns.reindex(symbols).to_numpy(dtype=np.float64)
+        sigma = covariance_matrix.loc[symbols, symbols].to_numpy(dtype=np.float64)
+        lambdas = np.ascontiguousarray(risk_aversions, dtype=np.float64)
+
+        # One solve for both right-hand sides: sigma^-1 @ [1, mu]
+        inv_ones, inv_mu = np.linalg.solve(sigma, np.column_stack((np.ones(len(mu)), mu))).T
+        w_min_var = inv_ones / inv_ones.sum()
+        tilt = inv_mu - inv_mu.sum() * w_min_var
+
+        weights = np.empty((len(lambdas), len(symbols)), dtype=np.float64)
+        markowitz_frontier(w_min_var, tilt, lambdas, weights)
+        return weights
+
     def optimize_risk_parity(
         self,
         symbols: list[str],
@@ -144,44 +236,26 @@ class PortfolioOptimizer:
         Returns:
             Dictionary of symbol -> allocation amount
         """
-        try:
-            from scipy.optimize import minimize
-        except ImportError:
-            return self.optimize_equal_weight(symbols, portfolio_value)
-
         n_assets = len(symbols)
+        sigma = np.ascontiguousarray(covariance_matrix.to_numpy(dtype=np.float64))
 
-        # Risk contribution function
-        def risk_contribution(weights):
-            portfolio_vol = np.sqrt(np.dot(weights.T, np.dot(covariance_matrix.values, weights)))
-            marginal_contrib = np.dot(covariance_matrix.values, weights) / portfolio_vol
-            contrib = weights * marginal_contrib
-            return contrib
+        min_weight = float(self.config.min_weight)
+        max_weight = float(self.config.max_weight)
 
-        # Objective: minimize sum of squared differences from equal risk contribution
-        def objective(weights):
-            contrib = risk_contribution(weights)
-            target_contrib = np.ones(n_assets) / n_assets
-            return np.sum((contrib - target_contrib) ** 2)
-
-        # Constraints
-        constraints = [{"type": "eq", "fun": lambda w: np.sum(w) - 1}]
-
-        # Bounds
-        bounds = tuple(
-            (float(self.config.min_weight), float(self.config.max_weight)) for _ in range(n_assets)
-        )
+        # Bounds that cannot sum to 1 fall back to equal weights
+        if not n_assets * min_weight <= 1.0 <= n_assets * max_weight:
+            return self.optimize_equal_weight(symbols, portfolio_value)
 
-        # Initial guess
-        x0 = np.array([1.0 / n_assets] * n_assets)
+        # Iterate from equal weights towards equal risk contribution
+        x0 = np.full(n_assets, 1.0 / n_assets)
+        weights = risk_parity_iterate(x0, sigma, _RISK_PARITY_TOL, _RISK_PARITY_MAX_ITER)
 
-        # Optimize
-        result = minimize(objective, x0, method="SLSQP", bounds=bounds, constraints=constraints)
+        # A degenerate covariance matrix (e.g. infinite variances) gives no usable weights
+        if not np.isfinite(weights).all():
+            return self.optimize_equal_weight(symbols, portfolio_value)
 
-        if result.success:
-            weights = result.x
-        else:
-            weights = np.array([1.0 / n_assets] * n_assets)
+        # Respect the per-asset weight bounds
+        weights = _scale_into_bounds(weights, min_weight, max_weight)
 
         allocations = {}
         for i, symbol in enumerate(symbols):
@@ -2,10 +2,13 @@
 from dataclasses import dataclass
 from decimal import Decimal
 from enum import Enum
-from typing import Optional
+from typing import Callable, Optional
 
+from .._compat import DATACLASS_SLOTS
 from ..engines.models import Position
 
+_ZERO = Decimal("0")
+
 
 class PositionLimit(Enum):
     """Position limit types."""
@@ -15,7 +18,7 @@ class PositionLimit(Enum):
     FIXED_UNITS = "fixed_units"  # Limit as fixed number of units
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class PositionConfig:
     """Configuration for position management."""
 
@@ -43,6 +46,20 @@ class PositionManager:
         self.config = config
         self.positions: dict[str, Position] = {}
 
+        # Limit type is fixed per manager, so pick the sizing rule once
+        self._max_position_value: Optional[Callable[[Decimal], Decimal]] = {
+            PositionLimit.PERCENTAGE: self._percentage_max_value,
+            PositionLimit.ABSOLUTE: self._absolute_max_value,
+        }.get(config.position_limit_type)
+
+    def _percentage_max_value(self, portfolio_value: Decimal) -> Decimal:
+        """Maximum position value as a fraction of the portfolio."""
+        return portfolio_value * self.config.max_position_size
+
+    def _absolute_max_value(self, portfolio_value: Decimal) -> Decimal:
+        """Maximum position value as a fixed amount."""
+        return self.config.max_position_size
+
     def calculate_position_size(
         self,
         symbol: str,
@@ -64,21 +81,15 @@ class PositionManager:
         Returns:
             Calculated position size (quantity)
         """
-        # Check if we already have a position
-        if symbol in self.positions:
-            existing_position = self.positions[symbol]
-            # For existing positions, calculate additional size
-            current_value = existing_position.market_value
-        else:
-            current_value = Decimal("0")
+        if self._max_position_value is None:  # FIXED_UNITS
+            return self.config.max_position_size
+
+        # For existing positions, calculate additional size
+        existing_position = self.positions.get(symbol)
+        current_value = existing_position.market_value if existing_position is not None else _ZERO
 
         # Calculate maximum position value based on config
-        if self.config.position_limit_type == PositionLimit.PERCENTAGE:
-            max_position_value = portfolio_value * self.config.max_position_size
-        elif self.config.position_limit_type == PositionLimit.ABSOLUTE:
-            max_position_value = self.config.max_position_size
-        else:  # FIXED_UNITS
-            return self.config.max_position_size
+        max_position_value = self._max_position_value(portfolio_value)
 
         # Use risk amount if provided
         if risk_amount is not None:
@@ -93,14 +104,14 @@ class PositionManager:
         if price > 0:
             quantity = position_value / price
         else:
-            quantity = Decimal("0")
+            quantity = _ZERO
 
         # Apply minimum position size check
         min_position_value = portfolio_value * self.config.min_position_size
-        min_quantity = min_position_value / price if price > 0 else Decimal("0")
+        min_quantity = min_position_value / price if price > 0 else _ZERO
 
         if quantity < min_quantity:
-            return Decimal("0")  # Position too small
+            return _ZERO  # Position too small
 
         return quantity
 
@@ -119,8 +130,7 @@ class PositionManager:
             return True  # Can add to existing position
 
         # Check max open positions limit
-        active_positions = sum(1 for p in self.positions.values() if p.quantity != 0)
-        if active_positions >= self.config.max_open_positions:
+        if self.get_position_count() >= self.config.max_open_positions:
             return False
 
         return True
@@ -175,8 +185,7 @@ class PositionManager:
         Returns:
             Total position value
         """
-        total = sum(p.market_value for p in self.positions.values())
-        return Decimal(str(total)) if total != 0 else Decimal("0")
+        return sum((p.market_value for p in self.positions.values()), _ZERO)
 
     def get_position_count(self) -> int:
         """
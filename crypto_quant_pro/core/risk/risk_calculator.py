@@ -6,8 +6,27 @@ from typing import Any, Optional
 import numpy as np
 import pandas as pd
 
+from .._numba_kernels import drawdown_stats
 from ..engines.models import Position
 
+# Trading days used to annualize daily statistics
+_TRADING_DAYS = 252
+
+# Shared results for empty or degenerate inputs
+_ZERO = Decimal("0")
+_NEUTRAL_BETA = Decimal("1.0")
+
+
+def _float_values(returns: pd.Series) -> np.ndarray:
+    """Returns as a float64 array with missing values dropped (like pandas skipna)."""
+    values = np.asarray(returns, dtype=np.float64)
+    return values[~np.isnan(values)]
+
+
+def _sample_std(values: np.ndarray) -> float:
+    """Sample standard deviation (ddof=1); NaN for fewer than two values, as in pandas."""
+    return float(values.std(ddof=1)) if values.size > 1 else float("nan")
+
 
 @dataclass
 class RiskMetrics:
@@ -50,10 +69,11 @@ class RiskCalculator:
         Returns:
             VaR value
         """
-        if len(returns) == 0:
-            return Decimal("0")
+        values = _float_values(returns)
+        if values.size == 0:
+            return _ZERO
 
-        var_value = np.percentile(returns, float((1 - confidence_level) * 100))
+        var_value = np.percentile(values, float((1 - confidence_level) * 100))
         return Decimal(str(abs(var_value)))
 
     def calculate_cvar(
@@ -71,11 +91,12 @@ class RiskCalculator:
         Returns:
             CVaR value
         """
-        if len(returns) == 0:
-            return Decimal("0")
+        values = _float_values(returns)
+        if values.size == 0:
+            return _ZERO
 
-        var_value = np.percentile(returns, float((1 - confidence_level) * 100))
-        cvar_value = returns[returns <= var_value].mean()
+        var_value = np.percentile(values, float((1 - confidence_level) * 100))
+        cvar_value = values[values <= var_value].mean()
         return Decimal(str(abs(cvar_value)))
 
     def calculate_volatility(self, returns: pd.Series, annualized: bool = True) -> Decimal:
@@ -89,13 +110,14 @@ class RiskCalculator:
         Returns:
             Volatility value
         """
-        if len(returns) == 0:
-            return Decimal("0")
+        values = _float_values(returns)
+        if values.size == 0:
+            return _ZERO
 
-        volatility = returns.std()
+        volatility = _sample_std(values)
         if annualized:
             # Annualize assuming 252 trading days
-            volatility = volatility * np.sqrt(252)
+            volatility = volatility * np.sqrt(_TRADING_DAYS)
 
         return Decimal(str(volatility))
 
@@ -114,18 +136,17 @@ class RiskCalculator:
         Returns:
             Sharpe ratio
         """
-        if len(returns) == 0:
-            return Decimal("0")
-
-        mean_return = returns.mean()
-        volatility = self.calculate_volatility(returns, annualized=True)
+        values = _float_values(returns)
+        if values.size == 0:
+            return _ZERO
 
+        volatility = _sample_std(values) * np.sqrt(_TRADING_DAYS)
         if volatility == 0:
-            return Decimal("0")
+            return _ZERO
 
         # Annualize mean return
-        annualized_return = mean_return * 252
-        sharpe = (Decimal(str(annualized_return)) - risk_free_rate) / volatility
+        annualized_return = values.mean() * _TRADING_DAYS
+        sharpe = (annualized_return - float(risk_free_rate)) / volatility
 
         return Decimal(str(sharpe))
 
@@ -144,20 +165,20 @@ class RiskCalculator:
         Returns:
             Sortino ratio
         """
-        if len(returns) == 0:
-            return Decimal("0")
+        values = _float_values(returns)
+        if values.size == 0:
+            return _ZERO
 
-        mean_return = returns.mean()
-        downside_returns = returns[returns < 0]
-        downside_std = downside_returns.std() if len(downside_returns) > 0 else Decimal("0.001")
+        downside_returns = values[values < 0]
+        downside_std = _sample_std(downside_returns) if downside_returns.size > 0 else 0.001
 
         if downside_std == 0:
-            return Decimal("0")
+            return _ZERO
 
         # Annualize
-        annualized_return = mean_return * 252
-        sortino = (Decimal(str(annualized_return)) - risk_free_rate) / (
-            Decimal(str(downside_std)) * Decimal(str(np.sqrt(252)))
+        annualized_return = values.mean() * _TRADING_DAYS
+        sortino = (annualized_return - float(risk_free_rate)) / (
+            downside_std * np.sqrt(_TRADING_DAYS)
         )
 
         return Decimal(str(sortino))
@@ -173,14 +194,14 @@ class RiskCalculator:
             Maximum drawdown as percentage
         """
         if len(equity_curve) < 2:
-            return Decimal("0")
+            return _ZERO
 
-        equity_array = np.array([float(v) for v in equity_curve])
-        peak = np.maximum.accumulate(equity_array)
-        drawdown = (equity_array - peak) / peak
-        max_dd = abs(np.min(drawdown))
+        equity_array = np.fromiter(
+            (float(v) for v in equity_curve), dtype=np.float64, count=len(equity_curve)
+        )
+        max_dd, _ = drawdown_stats(equity_array)
 
-        return Decimal(str(max_dd))
+        return Decimal(str(float(max_dd)))
 
     def calculate_beta(
         self,
@@ -198,19 +219,21 @@ class RiskCalculator:
             Beta value
         """
         if len(portfolio_returns) == 0 or len(market_returns) == 0:
-            return Decimal("1.0")
+            return _NEUTRAL_BETA
 
         # Align series
         aligned = pd.DataFrame({"portfolio": portfolio_returns, "market": market_returns}).dropna()
 
         if len(aligned) < 2:
-            return Decimal("1.0")
+            return _NEUTRAL_BETA
 
-        covariance = aligned["portfolio"].cov(aligned["market"])
-        market_variance = aligned["market"].var()
+        # Both moments from a single 2x2 covariance matrix
+        cov_matrix = np.cov(aligned.to_numpy(dtype=np.float64), rowvar=False)
+        covariance = cov_matrix[0, 1]
+        market_variance = cov_matrix[1, 1]
 
         if market_variance == 0:
-            return Decimal("1.0")
+            return _NEUTRAL_BETA
 
         beta = covariance / market_variance
         return Decimal(str(beta))
@@ -225,7 +248,14 @@ class RiskCalculator:
         Returns:
             Correlation matrix
         """
-        return returns_df.corr()
+        values = returns_df.to_numpy(dtype=np.float64)
+        if values.shape[1] < 2 or np.isnan(values).any():
+            # pandas handles missing values pairwise
+            return returns_df.corr()
+
+        return pd.DataFrame(
+            np.corrcoef(values, rowvar=False), index=returns_df.columns, columns=returns_df.columns
+        )
 
     def calculate_portfolio_risk_metrics(
         self,
@@ -276,7 +306,7 @@ class RiskCalculator:
         if market_returns is not None:
             beta = self.calculate_beta(portfolio_returns, market_returns)
         else:
-            beta = Decimal("1.0")
+            beta = _NEUTRAL_BETA
 
         # Calculate correlation matrix
         if historical_returns:
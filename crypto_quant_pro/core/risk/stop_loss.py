@@ -4,6 +4,14 @@ from decimal import Decimal
 from enum import Enum
 from typing import Optional
 
+import numpy as np
+
+from .._compat import DATACLASS_SLOTS
+
+# Decimal constants, built once rather than parsed on every call
+_ZERO = Decimal("0")
+_ONE = Decimal("1")
+
 
 class StopLossType(Enum):
     """Stop loss types."""
@@ -14,7 +22,7 @@ class StopLossType(Enum):
     TRAILING = "trailing"  # Trailing stop loss
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class StopLossConfig:
     """Configuration for stop loss."""
 
@@ -41,6 +49,12 @@ class StopLossManager:
         """
         self.config = config
         self.stop_loss_levels: dict[str, Decimal] = {}
+        # Float copies of the levels for the per-tick trigger checks
+        self._stop_levels_f: dict[str, float] = {}
+
+        # Price multipliers for percentage-based stops, fixed by the config
+        self._stop_factor = _ONE - config.stop_loss_value
+        self._trailing_factor = _ONE - config.trailing_percent
 
     def calculate_stop_loss(
         self,
@@ -62,29 +76,30 @@ class StopLossManager:
             Stop loss price
         """
         if not self.config.enable_stop_loss:
-            return Decimal("0")
+            return _ZERO
 
         if self.config.stop_loss_type == StopLossType.PERCENTAGE:
-            stop_loss = entry_price * (Decimal("1") - self.config.stop_loss_value)
+            stop_loss = entry_price * self._stop_factor
         elif self.config.stop_loss_type == StopLossType.ABSOLUTE:
             stop_loss = self.config.stop_loss_value
         elif self.config.stop_loss_type == StopLossType.ATR:
             if atr is None:
                 # Fallback to percentage if ATR not available
-                stop_loss = entry_price * (Decimal("1") - self.config.stop_loss_value)
+                stop_loss = entry_price * self._stop_factor
             else:
                 stop_loss = entry_price - (atr * self.config.atr_multiplier)
         else:  # TRAILING
             # Trailing stop: moves up but not down
             if symbol in self.stop_loss_levels:
                 current_stop = self.stop_loss_levels[symbol]
-                new_stop = current_price * (Decimal("1") - self.config.trailing_percent)
+                new_stop = current_price * self._trailing_factor
                 stop_loss = max(current_stop, new_stop)  # Only move up
             else:
-                stop_loss = current_price * (Decimal("1") - self.config.trailing_percent)
+                stop_loss = current_price * self._trailing_factor
 
         # Store stop loss level
         self.stop_loss_levels[symbol] = stop_loss
+        self._stop_levels_f[symbol] = float(stop_loss)
 
         return stop_loss
 
@@ -99,11 +114,26 @@ class StopLossManager:
         Returns:
             True if stop loss triggered, False otherwise
         """
-        if symbol not in self.stop_loss_levels:
-            return False
+        stop_loss_level = self._stop_levels_f.get(symbol)
+        return stop_loss_level is not None and float(current_price) <= stop_loss_level
+
+    def check_stop_loss_batch(self, symbols: list[str], prices: np.ndarray) -> np.ndarray:
+        """
+        Check stop losses for many symbols at once.
+
+        Args:
+            symbols: Trading symbols
+            prices: Current market prices aligned with ``symbols``
 
-        stop_loss_level = self.stop_loss_levels[symbol]
-        return current_price <= stop_loss_level
+        Returns:
+            Boolean array, True where the stop loss is triggered
+        """
+        levels = np.fromiter(
+            (self._stop_levels_f.get(symbol, -np.inf) for symbol in symbols),
+            dtype=np.float64,
+            count=len(symbols),
+        )
+        return np.asarray(prices, dtype=np.float64) <= levels
 
     def update_stop_loss(
         self,
@@ -134,6 +164,7 @@ class StopLossManager:
             symbol: Trading symbol
         """
         self.stop_loss_levels.pop(symbol, None)
+        self._stop_levels_f.pop(symbol, None)
 
     def get_stop_loss(self, symbol: str) -> Optional[Decimal]:
         """
@@ -7,6 +7,7 @@ from .buy_strategies import (
     RSIStrategy,
 )
 from .sell_strategies import (
+    PositionView,
     StopLossStrategy,
     TakeProfitStrategy,
     TrailingStopStrategy,
@@ -21,6 +22,7 @@ __all__ = [
     "MovingAverageCrossStrategy",
     "BreakoutStrategy",
     "RSIStrategy",
+    "PositionView",
     "StopLossStrategy",
     "TakeProfitStrategy",
     "TrailingStopStrategy",
@@ -6,8 +6,33 @@ from decimal import Decimal
 from enum import Enum
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
+from .._compat import DATACLASS_SLOTS
+
+# Side codes used by batch validation; anything else maps to an invalid code
+_SIDE_CODES = {"buy": 0, "sell": 1}
+_INVALID_SIDE = 255
+
+
+def _price_array(values: Any) -> np.ndarray:
+    """
+    Prices as a contiguous float array for the numeric kernels.
+
+    Float32 input (see ``DataCleaner.to_float32_ohlcv``) is kept as is; anything
+    else is converted to float64.
+
+    Args:
+        values: Price Series or array
+
+    Returns:
+        float32 or float64 ndarray
+    """
+    array = np.asarray(values)
+    dtype = np.float32 if array.dtype == np.float32 else np.float64
+    return np.ascontiguousarray(array, dtype=dtype)
+
 
 class StrategyDirection(Enum):
     """Strategy direction (bullish/bearish)."""
@@ -16,7 +41,14 @@ class StrategyDirection(Enum):
     PUT = "put"  # Bearish - expect price to fall
 
 
-@dataclass
+# Direction multipliers, built once and resolved with a single lookup
+_DIRECTION_MULTIPLIERS = {
+    StrategyDirection.CALL: Decimal("1.0"),
+    StrategyDirection.PUT: Decimal("-1.0"),
+}
+
+
+@dataclass(**DATACLASS_SLOTS)
 class StrategySignal:
     """Trading signal generated by a strategy."""
 
@@ -122,7 +154,7 @@ class BaseStrategy(ABC):
         if not self.enabled:
             return False
 
-        if signal.side not in ["buy", "sell"]:
+        if signal.side not in _SIDE_CODES:
             return False
 
         if signal.quantity is not None and signal.quantity <= 0:
@@ -133,6 +165,32 @@ class BaseStrategy(ABC):
 
         return True
 
+    def validate_signals_batch(self, signals: list[StrategySignal]) -> np.ndarray:
+        """
+        Validate many signals at once with the same rules as ``validate_signal``.
+
+        Sides, quantities and prices are packed into arrays and checked with a
+        single combined mask; a missing quantity or price counts as valid.
+
+        Args:
+            signals: Strategy signals to validate
+
+        Returns:
+            Boolean array, True where the signal is valid
+        """
+        n = len(signals)
+        if not self.enabled:
+            return np.zeros(n, dtype=bool)
+
+        sides = np.fromiter((_SIDE_CODES.get(s.side, _INVALID_SIDE) for s in signals), np.uint8, n)
+        quantities = np.fromiter(
+            (1.0 if s.quantity is None else float(s.quantity) for s in signals), np.float64, n
+        )
+        prices = np.fromiter(
+            (1.0 if s.price is None else float(s.price) for s in signals), np.float64, n
+        )
+        return (sides < len(_SIDE_CODES)) & (quantities > 0) & (prices > 0)
+
     def get_direction_multiplier(self) -> Decimal:
         """
         Get direction multiplier for profit calculation.
@@ -140,7 +198,7 @@ class BaseStrategy(ABC):
         Returns:
             1.0 for CALL (bullish), -1.0 for PUT (bearish)
         """
-        return Decimal("1.0") if self.direction == StrategyDirection.CALL else Decimal("-1.0")
+        return _DIRECTION_MULTIPLIERS[self.direction]
 
     def __str__(self) -> str:
         """String representation of strategy."""
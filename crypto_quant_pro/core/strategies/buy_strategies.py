@@ -3,9 +3,25 @@ from datetime import datetime
 from decimal import Decimal
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
-from .base import BaseStrategy, StrategyDirection, StrategySignal
+from .._numba_kernels import ma_cross_batch, rolling_rsi
+from .base import BaseStrategy, StrategyDirection, StrategySignal, _price_array
+
+
+def _trailing_means(values: np.ndarray, window: int) -> tuple[float, float]:
+    """
+    Moving average on the last bar and on the bar before it.
+
+    Args:
+        values: Price array with more than ``window`` elements
+        window: Moving average period
+
+    Returns:
+        Tuple of (current mean, previous mean)
+    """
+    return float(values[-window:].mean()), float(values[-window - 1 : -1].mean())
 
 
 class MovingAverageCrossStrategy(BaseStrategy):
@@ -55,44 +71,23 @@ class MovingAverageCrossStrategy(BaseStrategy):
         Returns:
             List of buy signals (empty if no signal)
         """
-        if len(market_data) < self.slow_period:
+        # A crossover needs both averages on the current and the previous bar
+        if len(market_data) <= max(self.fast_period, self.slow_period):
             return []
 
-        # Calculate moving averages
-        close_prices = market_data["close"]
-        fast_ma = close_prices.rolling(window=self.fast_period).mean()
-        slow_ma = close_prices.rolling(window=self.slow_period).mean()
-
-        # Check for crossover
-        if len(fast_ma) < 2 or len(slow_ma) < 2:
-            return []
-
-        current_fast = fast_ma.iloc[-1]
-        previous_fast = fast_ma.iloc[-2]
-        current_slow = slow_ma.iloc[-1]
-        previous_slow = slow_ma.iloc[-2]
+        # Only the last two values of each moving average are needed
+        closes = _price_array(market_data["close"])
+        current_fast, previous_fast = _trailing_means(closes, self.fast_period)
+        current_slow, previous_slow = _trailing_means(closes, self.slow_period)
 
         # Buy signal: fast MA crosses above slow MA
         if previous_fast <= previous_slow and current_fast > current_slow:
-            current_price = Decimal(str(close_prices.iloc[-1]))
-            portfolio_value = kwargs.get("portfolio_value", Decimal("10000"))
-
-            # Calculate position size (use 10% of portfolio)
-            position_size = portfolio_value * Decimal("0.1")
-            quantity = position_size / current_price
-
-            signal = StrategySignal(
-                symbol=symbol,
-                side="buy",
-                quantity=quantity,
-                price=current_price,
-                confidence=Decimal("0.7"),
-                metadata={
-                    "strategy": self.name,
-                    "fast_ma": float(current_fast),
-                    "slow_ma": float(current_slow),
-                    "crossover_type": "golden_cross",
-                },
+            signal = self._golden_cross_signal(
+                symbol,
+                Decimal(str(closes[-1])),
+                current_fast,
+                current_slow,
+                kwargs.get("portfolio_value", Decimal("10000")),
             )
 
             if self.validate_signal(signal):
@@ -100,6 +95,83 @@ class MovingAverageCrossStrategy(BaseStrategy):
 
         return []
 
+    async def generate_signals_batch(
+        self,
+        symbols: list[str],
+        closes: np.ndarray,
+        current_date: datetime,
+        positions: dict[str, Any],
+        **kwargs: Any,
+    ) -> list[StrategySignal]:
+        """
+        Generate buy signals for many symbols sharing the same bar history.
+
+        The crossover test runs in one parallel kernel over all rows; signals
+        are only built for symbols that crossed on the last bar.
+
+        Args:
+            symbols: Trading symbols, one per row of ``closes``
+            closes: Close prices of shape (len(symbols), n_bars)
+            current_date: Current date
+            positions: Current positions
+            **kwargs: Additional context
+
+        Returns:
+            List of buy signals in ``symbols`` order
+
+        Raises:
+            ValueError: If ``closes`` is not 2-D with one row per symbol
+        """
+        closes = _price_array(closes)
+        if closes.ndim != 2 or closes.shape[0] != len(symbols):
+            raise ValueError(f"closes shape {closes.shape} does not match {len(symbols)} symbols")
+        crosses = np.empty(len(symbols), dtype=np.int8)
+        ma_cross_batch(closes, self.fast_period, self.slow_period, crosses)
+
+        portfolio_value = kwargs.get("portfolio_value", Decimal("10000"))
+        candidates = []
+        for i in np.flatnonzero(crosses > 0):
+            current_fast, _ = _trailing_means(closes[i], self.fast_period)
+            current_slow, _ = _trailing_means(closes[i], self.slow_period)
+            signal = self._golden_cross_signal(
+                symbols[i],
+                Decimal(str(closes[i, -1])),
+                current_fast,
+                current_slow,
+                portfolio_value,
+            )
+            candidates.append(signal)
+
+        valid = self.validate_signals_batch(candidates)
+        return [signal for signal, ok in zip(candidates, valid) if ok]
+
+    def _golden_cross_signal(
+        self,
+        symbol: str,
+        current_price: Decimal,
+        current_fast: float,
+        current_slow: float,
+        portfolio_value: Decimal,
+    ) -> StrategySignal:
+        """Build the buy signal for a fast-over-slow crossover."""
+        # Calculate position size (use 10% of portfolio)
+        position_size = portfolio_value * Decimal("0.1")
+        quantity = position_size / current_price
+
+        return StrategySignal(
+            symbol=symbol,
+            side="buy",
+            quantity=quantity,
+            price=current_price,
+            confidence=Decimal("0.7"),
+            metadata={
+                "strategy": self.name,
+                "fast_ma": float(current_fast),
+                "slow_ma": float(current_slow),
+                "crossover_type": "golden_cross",
+            },
+        )
+
     def fit_day(
         self,
         today: pd.Series,
@@ -194,10 +266,10 @@ class BreakoutStrategy(BaseStrategy):
             return []
 
         # Calculate resistance level (highest high in lookback period)
-        high_prices = market_data["high"]
-        resistance = high_prices.rolling(window=self.lookback_period).max().iloc[-1]
+        high_prices = _price_array(market_data["high"])
+        resistance = float(high_prices[-self.lookback_period :].max())
 
-        current_price = Decimal(str(market_data["close"].iloc[-1]))
+        current_price = Decimal(str(_price_array(market_data["close"])[-1]))
         resistance_decimal = Decimal(str(resistance))
 
         # Check for breakout
@@ -303,13 +375,8 @@ class RSIStrategy(BaseStrategy):
 
     def _calculate_rsi(self, prices: pd.Series, period: int) -> pd.Series:
         """Calculate RSI indicator."""
-        delta = prices.diff()
-        gain = (delta.where(delta > 0, 0)).rolling(window=period).mean()
-        loss = (-delta.where(delta < 0, 0)).rolling(window=period).mean()
-
-        rs = gain / loss
-        rsi = 100 - (100 / (1 + rs))
-        return rsi
+        rsi = rolling_rsi(_price_array(prices), period)
+        return pd.Series(rsi, index=prices.index)
 
     async def generate_signals(
         self,
@@ -335,18 +402,18 @@ class RSIStrategy(BaseStrategy):
         if len(market_data) < self.period + 1:
             return []
 
-        close_prices = market_data["close"]
-        rsi = self._calculate_rsi(close_prices, self.period)
+        closes = _price_array(market_data["close"])
+        rsi = rolling_rsi(closes, self.period)
 
         if len(rsi) < 2:
             return []
 
-        current_rsi = Decimal(str(rsi.iloc[-1]))
-        previous_rsi = Decimal(str(rsi.iloc[-2]))
+        current_rsi = Decimal(str(rsi[-1]))
+        previous_rsi = Decimal(str(rsi[-2]))
 
         # Buy signal: RSI crosses above oversold level
         if previous_rsi <= self.oversold_level and current_rsi > self.oversold_level:
-            current_price = Decimal(str(close_prices.iloc[-1]))
+            current_price = Decimal(str(closes[-1]))
             portfolio_value = kwargs.get("portfolio_value", Decimal("10000"))
 
             # Calculate position size
@@ -1,11 +1,47 @@
 """Sell strategies for trading signals."""
+from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal
 from typing import Any, Optional
 
+import numpy as np
 import pandas as pd
 
-from .base import BaseStrategy, StrategyDirection, StrategySignal
+from .._compat import DATACLASS_SLOTS
+from .base import BaseStrategy, StrategyDirection, StrategySignal, _price_array
+
+
+@dataclass(**DATACLASS_SLOTS)
+class PositionView:
+    """Open positions flattened into float64 columns for batch evaluation."""
+
+    symbols: list[str]
+    entry_prices: np.ndarray
+    quantities: np.ndarray
+
+    @classmethod
+    def from_positions(cls, positions: dict[str, Any]) -> "PositionView":
+        """
+        Build a view from the ``{symbol: {"entry_price", "quantity"}}`` mapping.
+
+        Args:
+            positions: Current positions
+
+        Returns:
+            PositionView with one row per symbol, in mapping order
+        """
+        symbols = list(positions)
+        entry_prices = np.fromiter(
+            (positions[s].get("entry_price", 0) for s in symbols), np.float64, len(symbols)
+        )
+        quantities = np.fromiter(
+            (positions[s].get("quantity", 0) for s in symbols), np.float64, len(symbols)
+        )
+        return cls(symbols=symbols, entry_prices=entry_prices, quantities=quantities)
+
+    def held(self) -> np.ndarray:
+        """Boolean mask of rows with a positive entry price and quantity."""
+        return (self.entry_prices > 0) & (self.quantities > 0)
 
 
 class StopLossStrategy(BaseStrategy):
@@ -62,23 +98,13 @@ class StopLossStrategy(BaseStrategy):
         if entry_price <= 0 or quantity <= 0:
             return []
 
-        current_price = Decimal(str(market_data["close"].iloc[-1]))
+        current_price = Decimal(str(_price_array(market_data["close"])[-1]))
         stop_loss_price = entry_price * (Decimal("1") - self.stop_loss_pct)
 
         # Check if stop loss triggered
         if current_price <= stop_loss_price:
-            signal = StrategySignal(
-                symbol=symbol,
-                side="sell",
-                quantity=quantity,
-                price=current_price,
-                confidence=Decimal("1.0"),  # High confidence for stop loss
-                metadata={
-                    "strategy": self.name,
-                    "entry_price": float(entry_price),
-                    "stop_loss_price": float(stop_loss_price),
-                    "loss_pct": float((entry_price - current_price) / entry_price),
-                },
+            signal = self._stop_loss_signal(
+                symbol, entry_price, quantity, current_price, stop_loss_price
             )
 
             if self.validate_signal(signal):
@@ -86,6 +112,61 @@ class StopLossStrategy(BaseStrategy):
 
         return []
 
+    async def generate_signals_batch(
+        self, positions: PositionView, prices: np.ndarray
+    ) -> list[StrategySignal]:
+        """
+        Generate stop loss signals for all held symbols in one comparison.
+
+        Args:
+            positions: Flattened positions
+            prices: Latest price per row of ``positions``
+
+        Returns:
+            List of sell signals in ``positions.symbols`` order
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        stop_prices = positions.entry_prices * (1.0 - float(self.stop_loss_pct))
+        triggered = positions.held() & (prices <= stop_prices)
+
+        candidates = []
+        for i in np.flatnonzero(triggered):
+            entry_price = Decimal(str(positions.entry_prices[i]))
+            signal = self._stop_loss_signal(
+                positions.symbols[i],
+                entry_price,
+                Decimal(str(positions.quantities[i])),
+                Decimal(str(prices[i])),
+                entry_price * (Decimal("1") - self.stop_loss_pct),
+            )
+            candidates.append(signal)
+
+        valid = self.validate_signals_batch(candidates)
+        return [signal for signal, ok in zip(candidates, valid) if ok]
+
+    def _stop_loss_signal(
+        self,
+        symbol: str,
+        entry_price: Decimal,
+        quantity: Decimal,
+        current_price: Decimal,
+        stop_loss_price: Decimal,
+    ) -> StrategySignal:
+        """Build the sell signal for a triggered stop loss."""
+        return StrategySignal(
+            symbol=symbol,
+            side="sell",
+            quantity=quantity,
+            price=current_price,
+            confidence=Decimal("1.0"),  # High confidence for stop loss
+            metadata={
+                "strategy": self.name,
+                "entry_price": float(entry_price),
+                "stop_loss_price": float(stop_loss_price),
+                "loss_pct": float((entry_price - current_price) / entry_price),
+            },
+        )
+
     def fit_day(
         self,
         today: pd.Series,
@@ -182,7 +263,7 @@ class TakeProfitStrategy(BaseStrategy):
         if entry_price <= 0 or quantity <= 0:
             return []
 
-        current_price = Decimal(str(market_data["close"].iloc[-1]))
+        current_price = Decimal(str(_price_array(market_data["close"])[-1]))
         take_profit_price = entry_price * (Decimal("1") + self.take_profit_pct)
 
         # Check if take profit triggered
@@ -271,7 +352,12 @@ class TrailingStopStrategy(BaseStrategy):
         name = kwargs.pop("name", f"TrailingStop_{trailing_pct}")
         super().__init__(name=name, direction=StrategyDirection.CALL, **kwargs)
         self.trailing_pct = trailing_pct
-        self._trailing_stops: dict[str, Decimal] = {}  # Track trailing stops per symbol
+        self._trailing_factor = 1.0 - float(trailing_pct)
+        self._peaks: dict[str, float] = {}  # Highest price seen per symbol since entry
+
+        # High-water marks for the batch path, aligned with _high_water_symbols
+        self._high_water_symbols: list[str] = []
+        self._high_water_marks = np.empty(0, dtype=np.float64)
 
     async def generate_signals(
         self,
@@ -296,7 +382,7 @@ class TrailingStopStrategy(BaseStrategy):
         """
         if symbol not in positions:
             # Clean up trailing stop if position closed
-            self._trailing_stops.pop(symbol, None)
+            self._peaks.pop(symbol, None)
             return []
 
         position = positions[symbol]
@@ -306,25 +392,18 @@ class TrailingStopStrategy(BaseStrategy):
         if entry_price <= 0 or quantity <= 0:
             return []
 
-        current_price = Decimal(str(market_data["close"].iloc[-1]))
-
-        # Initialize or update trailing stop
-        if symbol not in self._trailing_stops:
-            # Initialize trailing stop at entry price - trailing_pct
-            self._trailing_stops[symbol] = entry_price * (Decimal("1") - self.trailing_pct)
-        else:
-            # Update trailing stop: move up if price increases, but don't move down
-            current_trailing = self._trailing_stops[symbol]
-            new_trailing = current_price * (Decimal("1") - self.trailing_pct)
+        last_close = float(_price_array(market_data["close"])[-1])
 
-            if new_trailing > current_trailing:
-                # Only move trailing stop up
-                self._trailing_stops[symbol] = new_trailing
-
-        trailing_stop = self._trailing_stops[symbol]
+        # Running peak since entry: the stop only ever moves up with it
+        peak = self._peaks.get(symbol, float(entry_price))
+        if last_close > peak:
+            peak = last_close
+        self._peaks[symbol] = peak
+        trailing_stop = peak * self._trailing_factor
 
         # Check if trailing stop triggered
-        if current_price <= trailing_stop:
+        if last_close <= trailing_stop:
+            current_price = Decimal(str(last_close))
             signal = StrategySignal(
                 symbol=symbol,
                 side="sell",
@@ -334,18 +413,81 @@ class TrailingStopStrategy(BaseStrategy):
                 metadata={
                     "strategy": self.name,
                     "entry_price": float(entry_price),
-                    "trailing_stop": float(trailing_stop),
-                    "max_price": float(kwargs.get("max_price", current_price)),
+                    "trailing_stop": trailing_stop,
+                    "max_price": float(kwargs.get("max_price", peak)),
                 },
             )
 
             if self.validate_signal(signal):
                 # Clean up trailing stop
-                self._trailing_stops.pop(symbol, None)
+                self._peaks.pop(symbol, None)
                 return [signal]
 
         return []
 
+    async def generate_signals_batch(
+        self, positions: PositionView, prices: np.ndarray
+    ) -> list[StrategySignal]:
+        """
+        Generate trailing stop signals for all held symbols in one pass.
+
+        High-water marks start at the entry price and are raised with
+        ``np.maximum`` on every call; a triggered row restarts from its entry.
+
+        Args:
+            positions: Flattened positions
+            prices: Latest price per row of ``positions``
+
+        Returns:
+            List of sell signals in ``positions.symbols`` order
+        """
+        prices = np.asarray(prices, dtype=np.float64)
+        high_water = self._aligned_high_water_marks(positions)
+        np.maximum(high_water, prices, out=high_water)
+
+        trailing_stops = high_water * self._trailing_factor
+        triggered = positions.held() & (prices <= trailing_stops)
+
+        rows = np.flatnonzero(triggered)
+        candidates = []
+        for i in rows:
+            current_price = Decimal(str(prices[i]))
+            signal = StrategySignal(
+                symbol=positions.symbols[i],
+                side="sell",
+                quantity=Decimal(str(positions.quantities[i])),
+                price=current_price,
+                confidence=Decimal("0.95"),
+                metadata={
+                    "strategy": self.name,
+                    "entry_price": float(positions.entry_prices[i]),
+                    "trailing_stop": float(trailing_stops[i]),
+                    "max_price": float(high_water[i]),
+                },
+            )
+            candidates.append(signal)
+
+        valid = self.validate_signals_batch(candidates)
+        # Sold rows restart from their entry price
+        sold = rows[valid]
+        high_water[sold] = positions.entry_prices[sold]
+        return [signal for signal, ok in zip(candidates, valid) if ok]
+
+    def _aligned_high_water_marks(self, positions: PositionView) -> np.ndarray:
+        """Return the high-water mark array, re-keyed if the held symbols changed."""
+        if positions.symbols != self._high_water_symbols:
+            previous = dict(zip(self._high_water_symbols, self._high_water_marks.tolist()))
+            self._high_water_marks = np.array(
+                [
+                    previous.get(symbol, entry)
+                    for symbol, entry in zip(positions.symbols, positions.entry_prices.tolist())
+                ],
+                dtype=np.float64,
+            )
+            self._high_water_symbols = list(positions.symbols)
+
+        return self._high_water_marks
+
     def fit_day(
         self,
         today: pd.Series,
@@ -12,7 +12,8 @@ class StrategyRegistry:
     """
 
     _strategies: dict[str, type[BaseStrategy]] = {}
-    _instances: dict[str, BaseStrategy] = {}
+    # Cached instances keyed by (name, frozenset of constructor kwargs)
+    _instances: dict[tuple[str, frozenset], BaseStrategy] = {}
 
     @classmethod
     def register(
@@ -69,16 +70,18 @@ class StrategyRegistry:
         Raises:
             KeyError: If strategy not found
         """
-        if name not in cls._strategies:
+        strategy_class = cls._strategies.get(name)
+        if strategy_class is None:
             raise KeyError(f"Strategy '{name}' not found in registry")
 
         # Create instance if not cached or if kwargs provided
-        cache_key = f"{name}_{hash(frozenset(kwargs.items()))}"
-        if cache_key not in cls._instances or kwargs:
-            strategy_class = cls._strategies[name]
-            cls._instances[cache_key] = strategy_class(name=name, **kwargs)
+        cache_key = (name, frozenset(kwargs.items()))
+        instance = None if kwargs else cls._instances.get(cache_key)
+        if instance is None:
+            instance = strategy_class(name=name, **kwargs)
+            cls._instances[cache_key] = instance
 
-        return cls._instances[cache_key]
+        return instance
 
     @classmethod
     def list_all(cls) -> list[str]:
@@ -100,7 +103,7 @@ class StrategyRegistry:
         """
         cls._strategies.pop(name, None)
         # Remove cached instances
-        cls._instances = {k: v for k, v in cls._instances.items() if not k.startswith(f"{name}_")}
+        cls._instances = {k: v for k, v in cls._instances.items() if k[0] != name}
 
     @classmethod
     def clear(cls) -> None:
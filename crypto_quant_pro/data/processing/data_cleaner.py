@@ -118,6 +118,27 @@ class DataCleaner:
 
         return df
 
+    @staticmethod
+    def to_float32_ohlcv(data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Cast the open/high/low/close columns to float32.
+
+        Halves the memory streamed by replayed backtests; float32 keeps about
+        seven significant digits, which is enough for comparisons and averages.
+
+        Args:
+            data: DataFrame with OHLC columns
+
+        Returns:
+            DataFrame with float32 price columns
+        """
+        df = data.copy()
+        for col in ("open", "high", "low", "close"):
+            if col in df.columns:
+                df[col] = df[col].astype(np.float32)
+
+        return df
+
     @staticmethod
     def remove_outliers(
         data: pd.DataFrame,
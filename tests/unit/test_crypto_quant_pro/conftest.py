@@ -0,0 +1,13 @@
+"""Shared fixtures for crypto_quant_pro tests."""
+import pytest
+
+
+@pytest.fixture(scope="session", autouse=True)
+def warm_numba_kernels():
+    """Compile (or load from cache) the Numba kernels once per test session."""
+    from crypto_quant_pro.core._jit import NUMBA_AVAILABLE
+
+    if NUMBA_AVAILABLE:
+        from crypto_quant_pro.core._numba_kernels import warmup
+
+        warmup()
@@ -57,6 +57,18 @@ def test_send_order():
     assert "BTC/USD" not in positions  # Closed
 
 
+def test_send_order_rejects_sub_satoshi_price():
+    """Test a price below satoshi resolution is rejected rather than filled at zero."""
+    adapter = AbuEngineAdapter(
+        "paper", config={"initial_balance": 100000, "max_position_size": 1.0}
+    )
+
+    order_id = adapter.send_order(symbol="PEPE/USD", quantity=1000, price=3e-9, order_type="limit")
+
+    assert order_id is None
+    assert "PEPE/USD" not in adapter.get_positions()
+
+
 def test_get_balance():
     """Test get_balance method."""
     adapter = AbuEngineAdapter("paper", config={"initial_balance": 10000})
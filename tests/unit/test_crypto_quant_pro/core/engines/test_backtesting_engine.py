@@ -1,7 +1,9 @@
 """Tests for BacktestingEngine."""
 from datetime import datetime, timedelta
 from decimal import Decimal
+from functools import lru_cache
 
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -13,24 +15,30 @@ from crypto_quant_pro.core.engines.backtesting_engine import (
 from crypto_quant_pro.data import MarketDataFeed, Timeframe
 
 
+@lru_cache(maxsize=16)
+def _gen_klines(start_date, end_date):
+    """Generate mock daily klines; cached, so callers must not mutate the result."""
+    dates = pd.date_range(start=start_date, end=end_date, freq="D")
+    n = len(dates)
+    idx = np.arange(n, dtype=np.float64)
+    data = {
+        "timestamp": dates,
+        "open": 100.0 + idx,
+        "high": 105.0 + idx,
+        "low": 95.0 + idx,
+        "close": 101.0 + idx,  # Upward trend
+        "volume": np.full(n, 1000.0),
+    }
+    return pd.DataFrame(data).set_index("timestamp")
+
+
 class MockHistoryFeed(MarketDataFeed):
     def __init__(self):
         super().__init__(market_type="crypto", name="mock")
 
     def get_klines(self, symbol, timeframe, start_date=None, end_date=None, limit=None):
-        # Generate mock data
-        dates = pd.date_range(start=start_date, end=end_date, freq="D")
-        data = {
-            "timestamp": dates,
-            "open": [100.0 + i for i in range(len(dates))],
-            "high": [105.0 + i for i in range(len(dates))],
-            "low": [95.0 + i for i in range(len(dates))],
-            "close": [101.0 + i for i in range(len(dates))],  # Upward trend
-            "volume": [1000.0 for _ in range(len(dates))],
-        }
-        df = pd.DataFrame(data)
-        df.set_index("timestamp", inplace=True)
-        return df
+        # Generate mock data (the engine owns its copy)
+        return _gen_klines(start_date, end_date).copy()
 
     def get_ticker(self, symbol):
         pass
@@ -121,3 +129,116 @@ async def test_backtest_buy_sell():
     assert engine.trades[0]["side"] == "buy"
     assert engine.trades[1]["side"] == "sell"
     assert engine.trades[1]["realized_pnl"] != 0
+
+
+def test_float32_cache_keeps_exact_prices():
+    """Test float32 bars stay float32 and still price fills at the quoted close."""
+    start_date = datetime(2023, 1, 1)
+    config = BacktestConfig(
+        start_date=start_date, end_date=start_date + timedelta(days=1), float32_ohlcv=True
+    )
+    engine = BacktestingEngine(config, MockHistoryFeed())
+    data = pd.DataFrame(
+        {"open": [101.1], "high": [102.3], "low": [100.7], "close": [101.1], "volume": [1000.0]},
+        index=pd.DatetimeIndex([start_date]),
+    )
+    engine.market_data_cache["BTC/USD"] = engine._prepare_cached_data(data)
+    engine.set_current_date(start_date)
+
+    prices, volume = engine._latest_bar("BTC/USD", start_date)
+
+    assert prices.dtype == np.float32
+    assert volume == 1000.0
+    assert engine._get_current_price("BTC/USD") == Decimal("101.1")
+
+
+def test_latest_bar_follows_replaced_cache():
+    """Test bar lookups see data replaced or extended after a first lookup."""
+    start_date = datetime(2023, 1, 1)
+    next_day = start_date + timedelta(days=1)
+    config = BacktestConfig(start_date=start_date, end_date=next_day)
+    engine = BacktestingEngine(config, MockHistoryFeed())
+    engine.market_data_cache["BTC/USD"] = _gen_klines(start_date, start_date).copy()
+    engine.set_current_date(next_day)
+    assert engine._get_current_price("BTC/USD") == Decimal("101")
+
+    engine.market_data_cache["BTC/USD"] = _gen_klines(start_date, next_day).copy()
+    assert engine._get_current_price("BTC/USD") == Decimal("102")
+
+    data = engine.market_data_cache["BTC/USD"]
+    data.loc[pd.Timestamp(next_day + timedelta(days=1))] = [1.0, 1.0, 1.0, 120.0, 1.0]
+    engine.set_current_date(next_day + timedelta(days=1))
+    assert engine._get_current_price("BTC/USD") == Decimal("120")
+
+
+def test_backtest_vectorized():
+    """Test backtest driven by a precomputed signal array."""
+    start_date = datetime(2023, 1, 1)
+    end_date = datetime(2023, 1, 10)
+    config = BacktestConfig(
+        start_date=start_date, end_date=end_date, initial_capital=Decimal("10000")
+    )
+    engine = BacktestingEngine(config, MockHistoryFeed())
+
+    dates = pd.date_range(start=start_date, end=end_date, freq="D")
+    prices = pd.Series(101.0 + np.arange(len(dates)), index=dates)
+
+    # Buy on the first bar, exit on the sixth, hold flat afterwards
+    signals = np.zeros(len(dates), dtype=np.int8)
+    signals[0] = 1
+    signals[5] = -1
+
+    result = engine.run_backtest_vectorized(signals, prices, "BTC/USD")
+
+    assert isinstance(result, BacktestResult)
+    assert result.total_trades == 2
+    assert result.trades[0]["side"] == "buy"
+    assert result.trades[1]["side"] == "sell"
+    assert result.trades[1]["realized_pnl"] > 0
+    assert result.profitable_trades == 1
+    assert len(result.portfolio_values) == len(dates) + 1
+    assert result.total_return > 0
+    assert "BTC/USD" not in engine.positions
+
+    # Buy and hold keeps the position open
+    hold = np.array([1] + [0] * (len(dates) - 1), dtype=np.int8)
+    result = engine.run_backtest_vectorized(hold, prices, "BTC/USD")
+    assert result.total_trades == 1
+    assert "BTC/USD" in engine.positions
+
+
+def test_backtest_vectorized_empty():
+    """Test the vectorized backtest returns a flat result for no bars."""
+    config = BacktestConfig(start_date=datetime(2023, 1, 1), end_date=datetime(2023, 1, 10))
+    engine = BacktestingEngine(config, MockHistoryFeed())
+
+    result = engine.run_backtest_vectorized(np.array([]), np.array([]), "BTC/USD")
+
+    assert result.total_return == Decimal("0")
+    assert result.total_trades == 0
+    assert result.trades == []
+    assert engine.get_cash() == config.initial_capital
+
+
+def test_backtest_trade_history_bound():
+    """Test max_trade_history keeps only the most recent trades."""
+    start_date = datetime(2023, 1, 1)
+    end_date = datetime(2023, 1, 10)
+    config = BacktestConfig(start_date=start_date, end_date=end_date, max_trade_history=1)
+    engine = BacktestingEngine(config, MockHistoryFeed())
+
+    dates = pd.date_range(start=start_date, end=end_date, freq="D")
+    prices = pd.Series(101.0 + np.arange(len(dates)), index=dates)
+    signals = np.zeros(len(dates), dtype=np.int8)
+    signals[0] = 1
+    signals[5] = -1
+
+    result = engine.run_backtest_vectorized(signals, prices, "BTC/USD")
+
+    assert len(engine.trades) == 1
+    assert isinstance(result.trades, list)
+    assert result.trades[0]["side"] == "sell"
+    # Metrics still count the evicted buy
+    assert result.total_trades == 2
+    assert result.profitable_trades == 1
+    assert result.win_rate == Decimal("1")
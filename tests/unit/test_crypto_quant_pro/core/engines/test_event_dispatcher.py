@@ -8,6 +8,7 @@ from crypto_quant_pro.core.engines.event_dispatcher import (
     Event,
     EventDispatcher,
     EventType,
+    enable_eager_tasks,
 )
 
 
@@ -108,3 +109,59 @@ async def test_event_priority():
     dispatcher.publish(event)
 
     assert execution_order == ["high", "low"]
+
+
+def test_event_priority_ties_keep_subscription_order():
+    """Test handlers with equal priority run in subscription order."""
+    dispatcher = EventDispatcher()
+    execution_order = []
+
+    def make_handler(label):
+        def handler(event):
+            execution_order.append(label)
+
+        return handler
+
+    dispatcher.subscribe(EventType.TICKER_UPDATE, make_handler("a"), priority=5)
+    dispatcher.subscribe(EventType.TICKER_UPDATE, make_handler("low"), priority=1)
+    dispatcher.subscribe(EventType.TICKER_UPDATE, make_handler("b"), priority=5)
+    dispatcher.subscribe(EventType.TICKER_UPDATE, make_handler("top"), priority=9)
+
+    event = Event(type=EventType.TICKER_UPDATE, timestamp=datetime.utcnow(), data={}, source="test")
+    dispatcher.publish(event)
+
+    assert execution_order == ["top", "a", "b", "low"]
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_restores_task_factory():
+    """Test stop removes the eager task factory that start installed."""
+    loop = asyncio.get_running_loop()
+    loop.set_task_factory(None)
+    dispatcher = EventDispatcher()
+
+    await dispatcher.start()
+    if hasattr(asyncio, "eager_task_factory"):
+        assert loop.get_task_factory() is asyncio.eager_task_factory
+    await dispatcher.stop()
+
+    assert loop.get_task_factory() is None
+
+
+@pytest.mark.asyncio
+async def test_event_dispatcher_keeps_foreign_task_factory():
+    """Test start and stop leave a caller's task factory in place."""
+    loop = asyncio.get_running_loop()
+
+    def factory(loop, coro, **kwargs):
+        return asyncio.Task(coro, loop=loop, **kwargs)
+
+    loop.set_task_factory(factory)
+    try:
+        assert enable_eager_tasks() is False
+        dispatcher = EventDispatcher()
+        await dispatcher.start()
+        await dispatcher.stop()
+        assert loop.get_task_factory() is factory
+    finally:
+        loop.set_task_factory(None)
@@ -5,7 +5,7 @@ from decimal import Decimal
 import pytest
 
 from crypto_quant_pro.core.engines.event_dispatcher import Event, EventType
-from crypto_quant_pro.core.engines.models import Order
+from crypto_quant_pro.core.engines.models import Order, from_sats, to_sats
 from crypto_quant_pro.core.engines.paper_trading_engine import (
     PaperTradingConfig,
     PaperTradingEngine,
@@ -154,3 +154,94 @@ async def test_ticker_update():
     assert position.current_price == Decimal("55000")
     assert position.unrealized_pnl == Decimal("5000")
     assert engine.get_unrealized_pnl() == Decimal("5000")
+
+
+@pytest.mark.asyncio
+async def test_satoshi_cash_ledger():
+    """Test cash and fees are settled exactly in integer satoshis."""
+    assert to_sats(Decimal("0.00000001")) == 1
+    assert from_sats(to_sats(Decimal("1234.5678"))) == Decimal("1234.5678")
+
+    config = PaperTradingConfig(
+        initial_balance=Decimal("1000"), max_position_size=Decimal("1.0"), slippage=Decimal("0")
+    )
+    engine = PaperTradingEngine(config)
+
+    order = Order(
+        symbol="ETH/USD",
+        side="buy",
+        quantity=Decimal("0.123"),
+        price=Decimal("3000.5"),
+        order_type="limit",
+    )
+    assert await engine.execute_order(order)
+
+    notional = Decimal("0.123") * Decimal("3000.5")
+    assert order.fees == notional * config.commission_maker
+    assert engine.get_available_balance() == Decimal("1000") - notional - order.fees
+
+
+@pytest.mark.asyncio
+async def test_satoshi_ledger_rounds_against_the_account():
+    """Test sub-satoshi amounts round debits up and credits down."""
+    config = PaperTradingConfig(
+        initial_balance=Decimal("10000"), max_position_size=Decimal("1.0"), slippage=Decimal("0")
+    )
+    engine = PaperTradingEngine(config)
+    rate = config.commission_maker
+    quantity = Decimal("0.333333333")
+
+    buy_price = Decimal("3000.123456789")
+    buy_order = Order(
+        symbol="ETH/USD", side="buy", quantity=quantity, price=buy_price, order_type="limit"
+    )
+    assert await engine.execute_order(buy_order)
+
+    cost = quantity * buy_price
+    debited = Decimal("10000") - engine.get_available_balance()
+    assert buy_order.filled_price == buy_price
+    assert buy_order.fees >= cost * rate
+    assert cost * (1 + rate) <= debited < cost * (1 + rate) + Decimal("0.0001")
+
+    balance = engine.get_available_balance()
+    sell_price = Decimal("3100.987654321")
+    sell_order = Order(
+        symbol="ETH/USD", side="sell", quantity=quantity, price=sell_price, order_type="limit"
+    )
+    assert await engine.execute_order(sell_order)
+
+    proceeds = quantity * sell_price
+    credited = engine.get_available_balance() - balance
+    assert sell_order.filled_price == sell_price
+    assert sell_order.fees >= proceeds * rate
+    assert proceeds * (1 - rate) - Decimal("0.0001") < credited <= proceeds * (1 - rate)
+
+
+@pytest.mark.asyncio
+async def test_unrealized_pnl_total_is_exact():
+    """Test the unrealized P&L total is an exact Decimal sum over positions."""
+    config = PaperTradingConfig(
+        initial_balance=Decimal("100000"), max_position_size=Decimal("1.0"), slippage=Decimal("0")
+    )
+    engine = PaperTradingEngine(config)
+
+    for symbol in ("BTC/USD", "ETH/USD"):
+        order = Order(
+            symbol=symbol,
+            side="buy",
+            quantity=Decimal("1"),
+            price=Decimal("100"),
+            order_type="limit",
+        )
+        assert await engine.execute_order(order)
+
+    for symbol, price in (("BTC/USD", "100.1"), ("ETH/USD", "100.2")):
+        event = Event(
+            type=EventType.TICKER_UPDATE,
+            timestamp=datetime.utcnow(),
+            data={"symbol": symbol, "price": price},
+            source="test",
+        )
+        engine._handle_ticker_update(event)
+
+    assert engine.get_unrealized_pnl() == Decimal("0.3")
@@ -90,6 +90,18 @@ async def test_place_order():
     await engine.stop()
 
 
+def test_validate_order_symbol_and_side():
+    """Test order validation rejects malformed symbols and sides."""
+    engine = TradingEngine(TradingConfig(paper_trading=True), MockDataFeed())
+    quantity, price = Decimal("0.1"), Decimal("500")
+
+    assert engine._validate_order("BTC/USD", "buy", quantity, price)
+    assert engine._validate_order("BTCUSDT", "sell", quantity, price)
+    assert not engine._validate_order("", "buy", quantity, price)
+    assert not engine._validate_order(" BTC/USD", "buy", quantity, price)
+    assert not engine._validate_order("BTC/USD", "hold", quantity, price)
+
+
 @pytest.mark.asyncio
 async def test_risk_check_max_position():
     """Test risk check for max positions."""
@@ -1,6 +1,7 @@
 """Tests for portfolio optimizer."""
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 
 from crypto_quant_pro.core.risk.portfolio_optimizer import (
@@ -77,6 +78,83 @@ def test_optimize_risk_parity():
     assert "ETH/USD" in allocations
 
 
+def test_optimize_risk_parity_respects_bounds():
+    """Test risk parity pins capped assets and rescales the rest within bounds."""
+    config = OptimizationConfig(
+        method=OptimizationMethod.RISK_PARITY,
+        max_weight=Decimal("0.3"),
+        min_weight=Decimal("0.05"),
+    )
+    optimizer = PortfolioOptimizer(config)
+
+    # Uncorrelated assets: unconstrained risk parity is [0.48, 0.24, 0.16, 0.12]
+    symbols = ["BTC/USD", "ETH/USD", "SOL/USD", "ADA/USD"]
+    covariance_matrix = pd.DataFrame(
+        np.diag([0.01, 0.04, 0.09, 0.16]), index=symbols, columns=symbols
+    )
+
+    allocations = optimizer.optimize_risk_parity(symbols, covariance_matrix, Decimal("1"))
+    weights = np.array([float(allocations[s]) for s in symbols])
+
+    np.testing.assert_allclose(weights, [0.3, 0.3, 0.4 * 4 / 7, 0.4 * 3 / 7], atol=1e-9)
+    assert weights.max() <= 0.3 + 1e-12
+    assert abs(weights.sum() - 1.0) < 1e-9
+
+
+def test_optimize_risk_parity_zero_variance():
+    """Test risk parity stays finite when zero-variance assets drive a weight to 0."""
+    config = OptimizationConfig(
+        method=OptimizationMethod.RISK_PARITY,
+        max_weight=Decimal("0.3"),
+        min_weight=Decimal("0.05"),
+    )
+    optimizer = PortfolioOptimizer(config)
+
+    # Nine riskless assets absorb the risk budget until the risky weight underflows
+    symbols = [f"STABLE{i}/USD" for i in range(9)] + ["BTC/USD"]
+    covariance_matrix = pd.DataFrame(np.diag([0.0] * 9 + [0.04]), index=symbols, columns=symbols)
+
+    allocations = optimizer.optimize_risk_parity(symbols, covariance_matrix, Decimal("1"))
+    weights = np.array([float(allocations[s]) for s in symbols])
+
+    assert np.isfinite(weights).all()
+    np.testing.assert_allclose(weights, [0.95 / 9] * 9 + [0.05], atol=1e-9)
+
+
+def test_optimize_risk_parity_degenerate_covariance():
+    """Test risk parity falls back to equal weights when the iteration is not finite."""
+    optimizer = PortfolioOptimizer(OptimizationConfig(method=OptimizationMethod.RISK_PARITY))
+
+    symbols = ["BTC/USD", "ETH/USD", "SOL/USD", "ADA/USD"]
+    covariance_matrix = pd.DataFrame(
+        np.diag([0.04, np.inf, 0.09, 0.16]), index=symbols, columns=symbols
+    )
+
+    allocations = optimizer.optimize_risk_parity(symbols, covariance_matrix, Decimal("100000"))
+
+    assert allocations == optimizer.optimize_equal_weight(symbols, Decimal("100000"))
+
+
+def test_optimize_markowitz_grid():
+    """Test mean-variance sweep over risk aversions."""
+    optimizer = PortfolioOptimizer(OptimizationConfig(method=OptimizationMethod.MARKOWITZ))
+
+    symbols = ["BTC/USD", "ETH/USD"]
+    expected_returns = pd.Series([0.1, 0.2], index=symbols)
+    covariance_matrix = pd.DataFrame([[0.04, 0.02], [0.02, 0.05]], index=symbols, columns=symbols)
+
+    weights = optimizer.optimize_markowitz_grid(
+        symbols, expected_returns, covariance_matrix, np.array([1e9, 10.0, 2.0])
+    )
+
+    assert weights.shape == (3, 2)
+    np.testing.assert_allclose(weights.sum(axis=1), 1.0)
+    # Very high risk aversion converges to the minimum-variance portfolio
+    np.testing.assert_allclose(weights[0], [0.6, 0.4], atol=1e-6)
+    # Lower risk aversion tilts towards the higher-return asset
+    assert weights[2, 1] > weights[1, 1] > weights[0, 1]
+
+
 def test_optimize_fallback():
     """Test optimization fallback when inputs missing."""
     config = OptimizationConfig(method=OptimizationMethod.MARKOWITZ)
@@ -60,6 +60,24 @@ def test_calculate_position_size_absolute():
     assert quantity == expected
 
 
+def test_calculate_position_size_fixed_units():
+    """Test position size calculation with a fixed unit limit."""
+    config = PositionConfig(
+        max_position_size=Decimal("2"),
+        position_limit_type=PositionLimit.FIXED_UNITS,
+    )
+    manager = PositionManager(config)
+
+    quantity = manager.calculate_position_size(
+        symbol="BTC/USD",
+        price=Decimal("50000"),
+        portfolio_value=Decimal("100000"),
+        available_cash=Decimal("10000"),
+    )
+
+    assert quantity == Decimal("2")
+
+
 def test_can_open_position():
     """Test position opening checks."""
     config = PositionConfig(max_open_positions=2)
@@ -202,3 +220,60 @@ def test_update_position_price():
     assert updated_position.current_price == Decimal("55000")
     assert updated_position.market_value == Decimal("55000")
     assert updated_position.unrealized_pnl == Decimal("5000")
+
+
+def test_position_aggregates_follow_updates():
+    """Test totals and counts track price updates and removals."""
+    manager = PositionManager(PositionConfig())
+
+    for symbol, quantity, price in [("BTC/USD", "1", "50000"), ("ETH/USD", "10", "3000")]:
+        manager.add_position(
+            symbol,
+            Position(
+                symbol=symbol,
+                quantity=Decimal(quantity),
+                entry_price=Decimal(price),
+                current_price=Decimal(price),
+                market_value=Decimal(quantity) * Decimal(price),
+                unrealized_pnl=Decimal("0"),
+            ),
+        )
+
+    manager.update_position_price("BTC/USD", Decimal("55000"))
+    assert manager.get_total_position_value() == Decimal("85000")
+    assert manager.get_position_count() == 2
+
+    manager.remove_position("BTC/USD")
+    assert manager.get_total_position_value() == Decimal("30000")
+    assert manager.get_position_count() == 1
+
+
+def test_position_aggregates_see_direct_changes():
+    """Test totals and counts follow positions changed outside the manager."""
+    manager = PositionManager(PositionConfig(max_open_positions=2))
+
+    for symbol, value in [("BTC/USD", "0.1"), ("ETH/USD", "0.2")]:
+        manager.add_position(
+            symbol,
+            Position(
+                symbol=symbol,
+                quantity=Decimal("1"),
+                entry_price=Decimal(value),
+                current_price=Decimal(value),
+                market_value=Decimal(value),
+                unrealized_pnl=Decimal("0"),
+            ),
+        )
+    assert manager.get_total_position_value() == Decimal("0.3")
+    assert not manager.can_open_position("LTC/USD")
+
+    position = manager.get_position("BTC/USD")
+    position.quantity = Decimal("0")
+    position.market_value = Decimal("0")
+    assert manager.get_total_position_value() == Decimal("0.2")
+    assert manager.get_position_count() == 1
+    assert manager.can_open_position("LTC/USD")
+
+    del manager.positions["ETH/USD"]
+    assert manager.get_total_position_value() == Decimal("0")
+    assert manager.get_position_count() == 0
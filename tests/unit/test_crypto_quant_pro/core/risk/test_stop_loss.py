@@ -1,6 +1,8 @@
 """Tests for stop loss manager."""
 from decimal import Decimal
 
+import numpy as np
+
 from crypto_quant_pro.core.risk.stop_loss import StopLossConfig, StopLossManager, StopLossType
 
 
@@ -92,6 +94,21 @@ def test_check_stop_loss():
     assert manager.check_stop_loss("BTC/USD", Decimal("47000")) is True
 
 
+def test_check_stop_loss_batch():
+    """Test vectorized stop loss check across symbols."""
+    config = StopLossConfig(stop_loss_type=StopLossType.PERCENTAGE, stop_loss_value=Decimal("0.05"))
+    manager = StopLossManager(config)
+    manager.calculate_stop_loss("BTC/USD", Decimal("50000"), Decimal("50000"))
+    manager.calculate_stop_loss("ETH/USD", Decimal("3000"), Decimal("3000"))
+
+    triggered = manager.check_stop_loss_batch(
+        ["BTC/USD", "ETH/USD", "LTC/USD"], np.array([47500.0, 2900.0, 1.0])
+    )
+
+    # LTC/USD has no stop loss and never triggers
+    assert triggered.tolist() == [True, False, False]
+
+
 def test_remove_stop_loss():
     """Test removing stop loss."""
     config = StopLossConfig()
@@ -63,10 +63,30 @@ def test_strategy_signal_validation():
     assert strategy.validate_signal(valid_signal) is False
 
 
+def test_validate_signals_batch_matches_scalar():
+    """Test batch validation agrees with validate_signal per signal."""
+    strategy = MockStrategy(name="test")
+    signals = [
+        StrategySignal(symbol="BTC/USD", side="buy", quantity=Decimal("1.0")),
+        StrategySignal(symbol="BTC/USD", side="sell"),
+        StrategySignal(symbol="BTC/USD", side="invalid"),
+        StrategySignal(symbol="BTC/USD", side="buy", quantity=Decimal("-1")),
+        StrategySignal(symbol="BTC/USD", side="sell", price=Decimal("0")),
+    ]
+
+    valid = strategy.validate_signals_batch(signals)
+    assert valid.tolist() == [strategy.validate_signal(s) for s in signals]
+    assert valid.tolist() == [True, True, False, False, False]
+
+    strategy.enabled = False
+    assert not strategy.validate_signals_batch(signals).any()
+
+
 def test_strategy_signal_metadata():
     """Test signal metadata initialization."""
     signal = StrategySignal(symbol="BTC/USD", side="buy")
     assert signal.metadata == {}
+    assert signal.metadata is not StrategySignal(symbol="ETH/USD", side="buy").metadata
 
     signal2 = StrategySignal(symbol="BTC/USD", side="buy", metadata={"key": "value"})
     assert signal2.metadata == {"key": "value"}
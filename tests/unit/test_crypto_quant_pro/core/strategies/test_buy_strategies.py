@@ -11,14 +11,15 @@ from crypto_quant_pro.core.strategies.buy_strategies import (
     BreakoutStrategy,
     RSIStrategy,
 )
+from crypto_quant_pro.data import DataCleaner
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_market_data():
     """Create sample market data."""
     dates = pd.date_range(start="2024-01-01", periods=50, freq="D")
-    np.random.seed(42)
-    prices = 100 + np.cumsum(np.random.randn(50) * 2)
+    rng = np.random.default_rng(42)
+    prices = 100 + np.cumsum(rng.standard_normal(50) * 2)
 
     return pd.DataFrame(
         {
@@ -27,7 +28,7 @@ def sample_market_data():
             "high": prices * 1.02,
             "low": prices * 0.98,
             "close": prices,
-            "volume": np.random.randint(1000, 10000, 50),
+            "volume": rng.integers(1000, 10000, 50),
         }
     )
 
@@ -90,6 +91,96 @@ async def test_moving_average_cross_strategy_with_crossover(sample_market_data):
     assert isinstance(signals, list)
 
 
+@pytest.mark.asyncio
+async def test_moving_average_cross_strategy_golden_cross():
+    """Test MA cross strategy fires when the fast MA crosses on the last bar."""
+    strategy = MovingAverageCrossStrategy(fast_period=2, slow_period=4)
+    prices = [10.0, 10.0, 10.0, 10.0, 9.0, 9.0, 9.0, 20.0]
+    market_data = pd.DataFrame({"close": prices, "high": prices, "low": prices})
+
+    signals = await strategy.generate_signals(
+        symbol="BTC/USD",
+        market_data=market_data,
+        current_date=datetime.now(),
+        positions={},
+        portfolio_value=Decimal("10000"),
+    )
+
+    assert len(signals) == 1
+    assert signals[0].metadata["fast_ma"] == 14.5
+    assert signals[0].metadata["slow_ma"] == 11.75
+
+
+@pytest.mark.asyncio
+async def test_moving_average_cross_strategy_batch():
+    """Test batch MA cross signals match the per-symbol path."""
+    strategy = MovingAverageCrossStrategy(fast_period=2, slow_period=4)
+    closes = np.array(
+        [
+            [10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0],
+            [10.0, 10.0, 10.0, 10.0, 9.0, 9.0, 9.0, 20.0],
+        ]
+    )
+
+    signals = await strategy.generate_signals_batch(
+        symbols=["ETH/USD", "BTC/USD"],
+        closes=closes,
+        current_date=datetime.now(),
+        positions={},
+        portfolio_value=Decimal("10000"),
+    )
+    expected = await strategy.generate_signals(
+        symbol="BTC/USD",
+        market_data=pd.DataFrame({"close": closes[1]}),
+        current_date=datetime.now(),
+        positions={},
+        portfolio_value=Decimal("10000"),
+    )
+
+    assert signals == expected
+
+
+@pytest.mark.asyncio
+async def test_moving_average_cross_strategy_batch_shape_mismatch():
+    """Test batch MA cross rejects closes that do not match the symbols."""
+    strategy = MovingAverageCrossStrategy(fast_period=2, slow_period=4)
+
+    with pytest.raises(ValueError):
+        await strategy.generate_signals_batch(
+            symbols=["ETH/USD", "BTC/USD"],
+            closes=np.full((3, 8), 10.0),
+            current_date=datetime.now(),
+            positions={},
+        )
+    with pytest.raises(ValueError):
+        await strategy.generate_signals_batch(
+            symbols=["BTC/USD"],
+            closes=np.full(8, 10.0),
+            current_date=datetime.now(),
+            positions={},
+        )
+
+
+@pytest.mark.asyncio
+async def test_moving_average_cross_strategy_float32_prices():
+    """Test MA cross accepts float32 OHLCV without changing the signal."""
+    strategy = MovingAverageCrossStrategy(fast_period=2, slow_period=4)
+    prices = [10.0, 10.0, 10.0, 10.0, 9.0, 9.0, 9.0, 20.1]  # 20.1 is inexact in float32
+    market_data = DataCleaner.to_float32_ohlcv(pd.DataFrame({"close": prices}))
+    assert market_data["close"].dtype == np.float32
+
+    signals = await strategy.generate_signals(
+        symbol="BTC/USD",
+        market_data=market_data,
+        current_date=datetime.now(),
+        positions={},
+        portfolio_value=Decimal("10000"),
+    )
+
+    assert len(signals) == 1
+    assert signals[0].price == Decimal("20.1")
+
+
 def test_breakout_strategy_initialization():
     """Test breakout strategy initialization."""
     strategy = BreakoutStrategy(lookback_period=20, breakout_threshold=Decimal("0.02"))
@@ -114,6 +205,30 @@ async def test_breakout_strategy_no_breakout(sample_market_data):
     assert isinstance(signals, list)
 
 
+@pytest.mark.asyncio
+async def test_breakout_strategy_uses_lookback_high():
+    """Test breakout resistance is the highest high of the lookback window only."""
+    strategy = BreakoutStrategy(lookback_period=3, breakout_threshold=Decimal("0.02"))
+    market_data = pd.DataFrame(
+        {
+            "high": [500.0, 100.0, 101.0, 110.0],
+            "low": [90.0, 90.0, 90.0, 90.0],
+            "close": [95.0, 95.0, 95.0, 120.0],
+        }
+    )
+
+    signals = await strategy.generate_signals(
+        symbol="BTC/USD",
+        market_data=market_data,
+        current_date=datetime.now(),
+        positions={},
+        portfolio_value=Decimal("10000"),
+    )
+
+    assert len(signals) == 1
+    assert signals[0].metadata["resistance"] == 110.0
+
+
 def test_rsi_strategy_initialization():
     """Test RSI strategy initialization."""
     strategy = RSIStrategy(period=14, oversold_level=Decimal("30"))
@@ -134,6 +249,21 @@ async def test_rsi_strategy_calculation(sample_market_data):
     assert not rsi.isna().all()  # Should have some valid values
 
 
+def test_rsi_matches_rolling_mean_reference(sample_market_data):
+    """Test RSI kernel against the pandas rolling-mean formula."""
+    strategy = RSIStrategy(period=14)
+    prices = sample_market_data["close"]
+
+    delta = prices.diff()
+    gain = delta.where(delta > 0, 0).rolling(window=14).mean()
+    loss = (-delta.where(delta < 0, 0)).rolling(window=14).mean()
+    expected = 100 - (100 / (1 + gain / loss))
+
+    rsi = strategy._calculate_rsi(prices, 14)
+
+    pd.testing.assert_series_equal(rsi, expected, check_names=False)
+
+
 @pytest.mark.asyncio
 async def test_rsi_strategy_no_signal(sample_market_data):
     """Test RSI strategy with no signal."""
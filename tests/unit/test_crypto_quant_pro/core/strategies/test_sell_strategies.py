@@ -3,16 +3,18 @@ import pytest
 from datetime import datetime
 from decimal import Decimal
 
+import numpy as np
 import pandas as pd
 
 from crypto_quant_pro.core.strategies.sell_strategies import (
+    PositionView,
     StopLossStrategy,
     TakeProfitStrategy,
     TrailingStopStrategy,
 )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_market_data():
     """Create sample market data."""
     dates = pd.date_range(start="2024-01-01", periods=20, freq="D")
@@ -83,6 +85,25 @@ async def test_stop_loss_strategy_triggered(sample_market_data):
     assert signals[0].side == "sell"
 
 
+@pytest.mark.asyncio
+async def test_stop_loss_strategy_batch():
+    """Test batch stop loss only fires for held symbols below their stop."""
+    strategy = StopLossStrategy(stop_loss_pct=Decimal("0.05"))
+    positions = PositionView.from_positions(
+        {
+            "BTC/USD": {"entry_price": 50000.0, "quantity": 1.0},
+            "ETH/USD": {"entry_price": 3000.0, "quantity": 2.0},
+            "SOL/USD": {"entry_price": 100.0, "quantity": 0.0},
+        }
+    )
+
+    signals = await strategy.generate_signals_batch(positions, np.array([47000.0, 2900.0, 50.0]))
+
+    assert [s.symbol for s in signals] == ["BTC/USD"]
+    assert signals[0].quantity == Decimal("1.0")
+    assert signals[0].metadata["stop_loss_price"] == 47500.0
+
+
 def test_take_profit_strategy_initialization():
     """Test take profit strategy initialization."""
     strategy = TakeProfitStrategy(take_profit_pct=Decimal("0.10"))
@@ -165,6 +186,26 @@ async def test_trailing_stop_strategy_updates(sample_market_data):
         positions=positions,
     )
 
-    # May or may not trigger depending on trailing stop calculation
-    assert isinstance(signals2, list)
+    # Peak 55000 puts the 5% trailing stop at 52250
+    assert len(signals2) == 1
+    assert signals2[0].metadata["trailing_stop"] == 55000.0 * 0.95
+
+
+@pytest.mark.asyncio
+async def test_trailing_stop_strategy_batch():
+    """Test batch trailing stop ratchets up with the high-water mark."""
+    strategy = TrailingStopStrategy(trailing_pct=Decimal("0.05"))
+    positions = PositionView.from_positions(
+        {
+            "BTC/USD": {"entry_price": 50000.0, "quantity": 1.0},
+            "ETH/USD": {"entry_price": 3000.0, "quantity": 2.0},
+        }
+    )
+
+    assert await strategy.generate_signals_batch(positions, np.array([55000.0, 3100.0])) == []
+
+    # BTC falls below 55000 * 0.95, ETH stays above 3100 * 0.95
+    signals = await strategy.generate_signals_batch(positions, np.array([52000.0, 3000.0]))
 
+    assert [s.symbol for s in signals] == ["BTC/USD"]
+    assert signals[0].metadata["max_price"] == 55000.0
@@ -103,3 +103,16 @@ def test_strategy_registry_exists():
     assert StrategyRegistry.exists("test") is True
     assert StrategyRegistry.exists("nonexistent") is False
 
+
+def test_strategy_registry_instance_cache():
+    """Test cached instances are reused and unregister only drops that name."""
+    StrategyRegistry.clear()
+    StrategyRegistry.register("test", MockStrategyForRegistry)
+    StrategyRegistry.register("test_other", MockStrategyForRegistry)
+
+    first = StrategyRegistry.get("test")
+    assert StrategyRegistry.get("test") is first
+    other = StrategyRegistry.get("test_other")
+
+    StrategyRegistry.unregister("test")
+    assert StrategyRegistry.get("test_other") is other
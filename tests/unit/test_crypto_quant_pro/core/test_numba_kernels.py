@@ -0,0 +1,146 @@
+"""Tests for shared numeric kernels."""
+import importlib
+
+import numpy as np
+
+from crypto_quant_pro.core import _jit
+from crypto_quant_pro.core._numba_kernels import (
+    _drawdown_stats_loop,
+    _drawdown_stats_numpy,
+    _equity_drawdown_loop,
+    _equity_drawdown_numpy,
+    _rolling_rsi_loop,
+    _rolling_rsi_numpy,
+    _risk_parity_iterate_loop,
+    _risk_parity_iterate_numpy,
+    drawdown_stats,
+    equity_drawdown,
+    ma_cross_batch,
+    risk_parity_iterate,
+)
+
+
+def test_drawdown_stats():
+    """Test max drawdown and drawdown duration."""
+    equity = np.array([100.0, 110.0, 99.0, 105.0, 88.0, 111.0, 100.0], dtype=np.float64)
+
+    max_dd, max_duration = drawdown_stats(equity)
+
+    # Peak 110 -> trough 88 = 20% drawdown, three bars below the peak
+    assert abs(max_dd - 0.2) < 1e-12
+    assert max_duration == 3
+
+
+def test_drawdown_stats_empty():
+    """Test drawdown stats on an empty curve."""
+    max_dd, max_duration = drawdown_stats(np.array([], dtype=np.float64))
+    assert max_dd == 0.0
+    assert max_duration == 0
+
+
+def test_drawdown_numpy_matches_loop():
+    """Test the NumPy drawdown fallbacks agree with the loop kernels."""
+    rng = np.random.default_rng(0)
+    closes = 100 + np.cumsum(rng.standard_normal(500))
+    cash = np.where(np.arange(500) < 250, 0.0, 1000.0)
+    quantity = np.where(np.arange(500) < 250, 10.0, 0.0)
+
+    max_dd, max_duration = _drawdown_stats_numpy(closes)
+    expected_dd, expected_duration = _drawdown_stats_loop(closes)
+    assert abs(max_dd - expected_dd) < 1e-12
+    assert max_duration == expected_duration
+
+    equity, max_dd, max_duration = _equity_drawdown_numpy(closes, cash, quantity, 1000.0)
+    expected = _equity_drawdown_loop(closes, cash, quantity, 1000.0)
+    np.testing.assert_allclose(equity, expected[0])
+    assert abs(max_dd - expected[1]) < 1e-12
+    assert max_duration == expected[2]
+
+
+def test_rolling_rsi_numpy_matches_loop():
+    """Test both RSI forms agree, including NaN on windows without moves."""
+    rng = np.random.default_rng(0)
+    closes = 100 + np.cumsum(rng.standard_normal(300))
+    closes = np.concatenate((closes, np.full(20, closes[-1]), [closes[-1] + 1.0]))
+
+    expected = _rolling_rsi_loop(closes, 14)
+
+    np.testing.assert_allclose(_rolling_rsi_numpy(closes, 14), expected, rtol=1e-9)
+    assert np.isnan(expected[-2])
+    assert expected[-1] == 100.0
+
+
+def test_equity_drawdown_matches_drawdown_stats():
+    """Test the fused mark-to-market pass agrees with drawdown_stats."""
+    closes = np.array([100.0, 110.0, 90.0, 95.0, 120.0], dtype=np.float64)
+    cash = np.array([500.0, 500.0, 500.0, 1500.0, 1500.0], dtype=np.float64)
+    quantity = np.array([5.0, 5.0, 5.0, 0.0, 0.0], dtype=np.float64)
+
+    equity, max_dd, max_duration = equity_drawdown(closes, cash, quantity, 1000.0)
+
+    np.testing.assert_allclose(equity, cash + quantity * closes)
+    expected_dd, expected_duration = drawdown_stats(np.concatenate(([1000.0], equity)))
+    assert abs(max_dd - expected_dd) < 1e-12
+    assert max_duration == expected_duration
+
+
+def test_ma_cross_batch():
+    """Test crossover direction per symbol row."""
+    closes = np.array(
+        [
+            [10.0, 10.0, 10.0, 10.0, 9.0, 9.0, 9.0, 20.0],  # Golden cross
+            [10.0, 10.0, 10.0, 10.0, 11.0, 11.0, 11.0, 1.0],  # Death cross
+            [10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0, 10.0],  # Flat
+        ],
+        dtype=np.float64,
+    )
+    out = np.empty(3, dtype=np.int8)
+
+    ma_cross_batch(closes, 2, 4, out)
+    np.testing.assert_array_equal(out, [1, -1, 0])
+
+    # Not enough bars for the previous slow MA
+    ma_cross_batch(closes[:, :4], 2, 4, out)
+    np.testing.assert_array_equal(out, [0, 0, 0])
+
+
+def test_risk_parity_iterate():
+    """Test risk parity weights equalize risk contributions."""
+    sigma = np.array([[0.04, 0.02], [0.02, 0.05]], dtype=np.float64)
+
+    weights = risk_parity_iterate(np.full(2, 0.5), sigma, 1e-12, 1000)
+
+    contrib = weights * (sigma @ weights)
+    assert abs(weights.sum() - 1.0) < 1e-12
+    assert abs(contrib[0] - contrib[1]) < 1e-10
+    assert weights[0] > weights[1]  # Lower-variance asset gets more weight
+
+
+def test_risk_parity_numpy_matches_loop():
+    """Test the NumPy risk parity iteration agrees with the loop kernel."""
+    sigma = np.array([[0.04, 0.01, 0.0], [0.01, 0.09, 0.02], [0.0, 0.02, 0.16]], dtype=np.float64)
+    x0 = np.full(3, 1.0 / 3.0)
+
+    np.testing.assert_allclose(
+        _risk_parity_iterate_numpy(x0, sigma, 1e-12, 1000),
+        _risk_parity_iterate_loop(x0, sigma, 1e-12, 1000),
+        atol=1e-10,
+    )
+
+
+def test_nojit_env_disables_numba(monkeypatch):
+    """Test CRYPTOQ_NOJIT swaps in the no-op decorator."""
+    monkeypatch.setenv("CRYPTOQ_NOJIT", "1")
+    try:
+        jit = importlib.reload(_jit)
+
+        def kernel(x):
+            return x
+
+        assert not jit.NUMBA_AVAILABLE
+        assert jit.njit(kernel) is kernel
+        assert jit.njit(cache=True)(kernel) is kernel
+        assert jit.prange is range
+    finally:
+        monkeypatch.delenv("CRYPTOQ_NOJIT")
+        importlib.reload(_jit)